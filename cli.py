@@ -29,6 +29,9 @@ console = Console()
 # Cache for built graph (avoid rebuilding for multiple commands)
 _graph_cache = {}
 
+# GraphBuilder logging options, set from the command line in cli()
+_builder_logging = {"log_level": "INFO", "rich_output": False}
+
 
 def _get_builder(project_root: Path = None) -> GraphBuilder:
     """Get or create a graph builder with cached graph."""
@@ -39,6 +42,7 @@ def _get_builder(project_root: Path = None) -> GraphBuilder:
 
     if cache_key not in _graph_cache:
         builder_config = {
+            **_builder_logging,
             "exclude_patterns": [
                 "**/node_modules/**",
                 "**/.godot/**",
@@ -66,8 +70,11 @@ def cli(ctx, verbose):
     ctx.ensure_object(dict)
     ctx.obj["verbose"] = verbose
 
+    # Rich console logs when a user is watching or asked for detail
+    _builder_logging["rich_output"] = verbose or sys.stderr.isatty()
+    _builder_logging["log_level"] = "DEBUG" if verbose else "INFO"
     if verbose:
-        setup_logger(level="DEBUG")
+        setup_logger(level="DEBUG", rich_output=True)
 
 
 @cli.command()
@@ -111,7 +118,7 @@ def scan(ctx, project_root, output, include, exclude):
         border_style="blue"
     ))
 
-    builder_config = {}
+    builder_config = dict(_builder_logging)
     if include:
         builder_config["include_patterns"] = list(include)
     if exclude:
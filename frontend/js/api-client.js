@@ -10,15 +10,23 @@ class ApiClient {
     }
 
     /**
-     * Make a GET request to the API.
+     * Build an API URL, skipping empty query parameters.
      */
-    async get(endpoint, params = {}) {
+    buildUrl(endpoint, params = {}) {
         const url = new URL(this.baseUrl + endpoint, window.location.origin);
         Object.entries(params).forEach(([key, value]) => {
             if (value !== null && value !== undefined && value !== '') {
                 url.searchParams.append(key, value);
             }
         });
+        return url;
+    }
+
+    /**
+     * Make a GET request to the API.
+     */
+    async get(endpoint, params = {}) {
+        const url = this.buildUrl(endpoint, params);
 
         try {
             const response = await fetch(url);
@@ -56,9 +64,48 @@ class ApiClient {
 
     /**
      * Get full graph data with optional filters.
+     * The server streams newline-delimited JSON records; they are parsed
+     * as chunks arrive and assembled into { nodes, edges, total_nodes, total_edges }.
      */
     async getGraph(filters = {}) {
-        const data = await this.get('/api/graph', filters);
+        const url = this.buildUrl('/api/graph', filters);
+
+        const data = { nodes: [], edges: [], total_nodes: 0, total_edges: 0 };
+        const handleLine = (line) => {
+            if (!line) return;
+            const record = JSON.parse(line);
+            if (record.type === 'node') {
+                data.nodes.push(record.data);
+            } else if (record.type === 'edge') {
+                data.edges.push(record.data);
+            } else if (record.type === 'summary') {
+                Object.assign(data, record.data);
+            }
+        };
+
+        try {
+            const response = await fetch(url);
+            if (!response.ok) {
+                throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+            }
+
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            let buffer = '';
+            while (true) {
+                const { done, value } = await reader.read();
+                if (done) break;
+                buffer += decoder.decode(value, { stream: true });
+                const lines = buffer.split('\n');
+                buffer = lines.pop();
+                lines.forEach(handleLine);
+            }
+            handleLine(buffer + decoder.decode());
+        } catch (error) {
+            console.error('API GET /api/graph failed:', error);
+            throw error;
+        }
+
         this.lastUpdate = new Date();
         return data;
     }
@@ -33,5 +33,6 @@ if __name__ == "__main__":
 """)
 
     app = create_app(args.project)
+    app.config["RICH_LOGGING"] = sys.stderr.isatty()
     # Disable reloader due to Python 3.13 watchdog compatibility issue
     app.run(host=args.host, port=args.port, debug=True, threaded=True, use_reloader=False)
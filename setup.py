@@ -13,6 +13,8 @@ setup(
     install_requires=[
         "flask>=3.0.0",
         "flask-socketio>=5.3.0",
+        "flask-compress>=1.14",
+        "orjson>=3.9.10",
         "watchdog>=3.0.0",
         "networkx>=3.2.1",
         "pyyaml>=6.0.1",
@@ -109,11 +109,16 @@ class GraphBuilder:
 
         Args:
             project_root: Root directory of the project to analyze
-            config: Optional configuration dictionary
+            config: Optional configuration dictionary. "log_level" and
+                "rich_output" configure the builder's console logging.
         """
         self.project_root = Path(project_root)
         self.config = config or {}
-        self.logger = setup_logger("graph_builder")
+        self.logger = setup_logger(
+            "graph_builder",
+            level=self.config.get("log_level", "INFO"),
+            rich_output=self.config.get("rich_output", False)
+        )
 
         # Initialize parsers
         self.gdscript_parser = GDScriptParser(self.project_root)
@@ -188,11 +193,12 @@ class GraphBuilder:
                 continue
 
             # Track file types
-            if file_path.suffix == ".gd":
+            suffix = file_path.suffix
+            if suffix == ".gd":
                 stats.gdscript_files += 1
-            elif file_path.suffix == ".tscn":
+            elif suffix == ".tscn":
                 stats.tscn_files += 1
-            elif file_path.suffix in (".ts", ".js"):
+            elif suffix in (".ts", ".js"):
                 stats.typescript_files += 1
 
             # Store parse result
@@ -230,13 +236,14 @@ class GraphBuilder:
 
     def _parse_file(self, file_path: Path) -> Optional[ParseResult]:
         """Parse a single file with the appropriate parser."""
+        suffix = file_path.suffix
         try:
-            if file_path.suffix == ".gd":
+            if suffix == ".gd":
                 return self.gdscript_parser.parse_file(file_path)
-            elif file_path.suffix == ".tscn":
+            elif suffix == ".tscn":
                 return self.tscn_parser.parse_file(file_path)
             else:
-                self.logger.debug(f"No parser for {file_path.suffix}")
+                self.logger.debug(f"No parser for {suffix}")
                 return None
         except Exception as e:
             self.logger.error(f"Error parsing {file_path}: {e}")
@@ -1,5 +1,6 @@
 """Graph query system for finding paths, dependencies, and usages."""
 
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional, Iterator
@@ -271,10 +272,10 @@ class GraphQueries:
             return result
 
         visited = set()
-        to_visit = [(node_id, 0, None, None)]  # (id, depth, edge_type, from_id)
+        to_visit = deque([(node_id, 0, None, None)])  # (id, depth, edge_type, from_id)
 
         while to_visit:
-            current_id, current_depth, edge_type, from_id = to_visit.pop(0)
+            current_id, current_depth, edge_type, from_id = to_visit.popleft()
 
             if current_id in visited or current_depth > depth:
                 continue
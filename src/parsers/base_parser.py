@@ -4,8 +4,12 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 import hashlib
+import io
+import mmap
+import re
+import sys
 
 
 class NodeType(Enum):
@@ -40,6 +44,10 @@ class EdgeType(Enum):
     ATTACHES_TO = auto()
 
 
+# Lowercased type names used as node ID prefixes, computed once
+_NODE_ID_PREFIX = {node_type: sys.intern(node_type.name.lower()) for node_type in NodeType}
+
+
 class Confidence(Enum):
     """Confidence level for parsed relationships."""
     HIGH = "high"
@@ -48,7 +56,7 @@ class Confidence(Enum):
     AMBIGUOUS = "ambiguous"
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedNode:
     """Represents a parsed code element (function, variable, signal, etc.)."""
     id: str
@@ -76,7 +84,7 @@ class ParsedNode:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedEdge:
     """Represents a relationship between two code elements."""
     source_id: str
@@ -124,11 +132,35 @@ class ParseResult:
         return len(self.edges)
 
 
+def combine_patterns(patterns: dict[str, re.Pattern], names: tuple[str, ...]) -> re.Pattern:
+    """Join anchored patterns into one alternation with a named group each.
+
+    Alternatives are tried in the order given, so the first pattern that
+    would have matched on its own wins. Each pattern keeps its own groups in
+    order, so group ``i`` of pattern ``name`` is
+    ``match.group(combined.groupindex[name] + i)``.
+    """
+    return re.compile("|".join(
+        f"(?P<{name}>{patterns[name].pattern.lstrip('^')})" for name in names
+    ))
+
+
 class BaseParser(ABC):
     """Base class for all language-specific parsers."""
 
+    # Upper bound on memoized res:// path conversions per parser
+    GODOT_PATH_CACHE_SIZE = 10_000
+
+    # Upper bound on parse results kept for unchanged files per parser
+    PARSE_CACHE_SIZE = 4096
+
+    _NEWLINE_RE = re.compile("\n")
+
     def __init__(self, project_root: Path):
         self.project_root = project_root
+        self._ext_set = frozenset(ext.lower() for ext in self.supported_extensions())
+        self._godot_path_cache: dict[str, Optional[Path]] = {}
+        self._parse_cache: dict[tuple[str, str], ParseResult] = {}
 
     @abstractmethod
     def parse_file(self, file_path: Path) -> ParseResult:
@@ -142,7 +174,7 @@ class BaseParser(ABC):
 
     def can_parse(self, file_path: Path) -> bool:
         """Check if this parser can handle the given file."""
-        return file_path.suffix.lower() in self.supported_extensions()
+        return file_path.suffix.lower() in self._ext_set
 
     def generate_node_id(
         self,
@@ -167,7 +199,7 @@ class BaseParser(ABC):
         # Create safe name identifier
         safe_name = name.replace(".", "_").replace("/", "_").replace(" ", "_")
 
-        return f"{node_type.name.lower()}_{file_id}_{safe_name}_{line_number}"
+        return f"{_NODE_ID_PREFIX[node_type]}_{file_id}_{safe_name}_{line_number}"
 
     def compute_file_hash(self, file_path: Path) -> str:
         """Compute MD5 hash of file contents for change detection."""
@@ -177,6 +209,67 @@ class BaseParser(ABC):
         except Exception:
             return ""
 
+    def read_for_parse(self, file_path: Path) -> tuple[str, str]:
+        """Read a file once for both hashing and parsing.
+
+        The file is memory-mapped so the hash and the decoded text are
+        produced from a single read of the underlying bytes.
+
+        Returns:
+            Tuple of (MD5 hex digest, decoded UTF-8 text)
+        """
+        with open(file_path, "rb") as f:
+            # mmap cannot map zero-length files
+            if f.seek(0, 2) == 0:
+                return hashlib.md5(b"").hexdigest(), ""
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return hashlib.md5(mm).hexdigest(), str(mm, "utf-8", "replace")
+
+    def read_lines_for_parse(self, file_path: Path) -> tuple[str, Iterator[str]]:
+        """Read a file once for hashing and line-by-line parsing.
+
+        Uses read_for_parse, so the hash and the lines come from the same
+        bytes: a result cached under the hash always matches its content.
+
+        Returns:
+            Tuple of (MD5 hex digest, iterator of decoded lines). Lines keep
+            their trailing "\n"; line endings are translated as in text mode.
+        """
+        file_hash, content = self.read_for_parse(file_path)
+        # StringIO with newline=None splits lines as text mode does
+        return file_hash, iter(io.StringIO(content, newline=None))
+
+    def get_cached_result(self, file_path: str, file_hash: str) -> Optional[ParseResult]:
+        """Get the result of an earlier parse of the same file contents.
+
+        Args:
+            file_path: Path string the result was stored under
+            file_hash: Hash of the file contents being parsed now
+
+        Returns:
+            The cached ParseResult, or None if the file is new or changed
+        """
+        cache = self._parse_cache
+        key = (file_path, file_hash)
+        result = cache.pop(key, None)
+        if result is not None:
+            # Re-insert to mark as most recently used
+            cache[key] = result
+        return result
+
+    def cache_result(self, result: ParseResult) -> ParseResult:
+        """Remember a parse result under its file path and hash.
+
+        Returns:
+            The same result, so parsers can ``return self.cache_result(result)``
+        """
+        cache = self._parse_cache
+        # Evict the least recently used entry once full
+        if len(cache) >= self.PARSE_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[(result.file_path, result.file_hash)] = result
+        return result
+
     def get_code_snippet(
         self,
         lines: list[str],
@@ -200,6 +293,47 @@ class BaseParser(ABC):
         snippet_lines = lines[start:end]
         return "\n".join(snippet_lines)
 
+    def compute_line_starts(self, content: str) -> list[int]:
+        """Get the offset at which each line of content starts.
+
+        ``bisect_right(line_starts, offset)`` maps a character offset back
+        to its 1-based line number.
+        """
+        line_starts = [0]
+        line_starts.extend(m.end() for m in self._NEWLINE_RE.finditer(content))
+        return line_starts
+
+    def get_buffer_snippet(
+        self,
+        content: str,
+        line_starts: list[int],
+        line_number: int,
+        context_lines: int = 2
+    ) -> str:
+        """Extract code snippet around a specific line straight from the buffer.
+
+        Same result as get_code_snippet over ``content.split("\\n")``, taken
+        as a single slice instead of joining a list of lines.
+
+        Args:
+            content: Full file text with "\\n" line endings
+            line_starts: Line start offsets from compute_line_starts
+            line_number: 1-based line number
+            context_lines: Number of lines before/after to include
+
+        Returns:
+            Code snippet with surrounding context
+        """
+        # A trailing newline does not start another line
+        line_count = len(line_starts) - content.endswith("\n")
+        idx = line_number - 1  # Convert to 0-based
+        start = max(0, idx - context_lines)
+        end = min(line_count, idx + context_lines + 1)
+
+        # Stop before the newline that ends the last included line
+        stop = line_starts[end] - 1 if end < len(line_starts) else len(content)
+        return content[line_starts[start]:stop]
+
     def get_relative_path(self, file_path: Path) -> str:
         """Get path relative to project root as string."""
         try:
@@ -216,8 +350,18 @@ class BaseParser(ABC):
         Returns:
             Absolute Path or None if invalid
         """
-        if not godot_path.startswith("res://"):
-            return None
+        cache = self._godot_path_cache
+        if godot_path in cache:
+            return cache[godot_path]
 
-        relative_path = godot_path[6:]  # Remove 'res://'
-        return self.project_root / relative_path
+        if not godot_path.startswith("res://"):
+            resolved = None
+        else:
+            relative_path = godot_path[6:]  # Remove 'res://'
+            resolved = self.project_root / relative_path
+
+        # Evict the oldest entry once full (dicts preserve insertion order)
+        if len(cache) >= self.GODOT_PATH_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[godot_path] = resolved
+        return resolved
@@ -1,6 +1,8 @@
 """GDScript parser for extracting code structure and relationships."""
 
 import re
+import sys
+from bisect import bisect_right
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
@@ -13,10 +15,14 @@ from .base_parser import (
     NodeType,
     EdgeType,
     Confidence,
+    combine_patterns,
 )
 
 
-@dataclass
+_LANGUAGE = sys.intern("gdscript")
+
+
+@dataclass(slots=True, frozen=True)
 class FunctionContext:
     """Tracks current function context during parsing."""
     name: str
@@ -101,6 +107,30 @@ class GDScriptParser(BaseParser):
         "dynamic_set": re.compile(r'\bset\s*\(\s*["\'](\w+)["\']\s*,'),
     }
 
+    # Declaration patterns for the first pass, in match priority order
+    VARIABLE_PATTERNS = ("export_var", "onready_var", "var_decl")
+    FIRST_PASS_RE = combine_patterns(PATTERNS, (
+        "class_name", "extends", "signal_def", "func_def", "static_func",
+        *VARIABLE_PATTERNS,
+    ))
+    # First characters of a stripped line that FIRST_PASS_RE can match:
+    # class_name, extends, signal/static, func, var and @export/@onready
+    DECLARATION_STARTS = frozenset("cesfv@")
+
+    # const_decl for a whole file buffer: anchored per line, with whitespace
+    # kept from crossing line breaks
+    CONST_DECL_ALL = re.compile(
+        r"^[^\S\n]*const[^\S\n]+(\w+)(?:[^\S\n]*:[^\S\n]*(\w+))?[^\S\n]*=[^\S\n]*(.+)",
+        re.MULTILINE
+    )
+
+    # Patterns scanned per line while extracting relationships
+    RELATIONSHIP_PATTERNS = (
+        "signal_emit_new", "signal_emit_old", "signal_connect_new",
+        "method_call", "preload", "load", "dollar_path", "get_node",
+        "dynamic_call", "get_node_var",
+    )
+
     # Built-in functions to ignore
     BUILTIN_FUNCTIONS = {
         # Lifecycle
@@ -123,54 +153,173 @@ class GDScriptParser(BaseParser):
 
     def parse_file(self, file_path: Path) -> ParseResult:
         """Parse a GDScript file and extract all code elements."""
+        # One shared string per file for every node's file_path
+        file_path_str = sys.intern(str(file_path))
         result = ParseResult(
-            file_path=str(file_path),
-            file_hash=self.compute_file_hash(file_path),
+            file_path=file_path_str,
+            file_hash="",
         )
 
         try:
-            content = file_path.read_text(encoding="utf-8")
-            lines = content.splitlines()
+            result.file_hash, content = self.read_for_parse(file_path)
         except Exception as e:
             result.errors.append(f"Failed to read file: {e}")
             return result
 
+        # Unchanged since the last parse
+        cached = self.get_cached_result(file_path_str, result.file_hash)
+        if cached is not None:
+            return cached
+
+        # Translate line endings as text mode would, so that line offsets
+        # into the buffer and the split lines agree
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+        # Snippets are sliced straight out of the buffer using these offsets
+        line_starts = self.compute_line_starts(content)
+        lines = content.split("\n")
+
+        # A line can yield several nodes; they all share one snippet string
+        snippet_cache: dict[tuple[int, int], str] = {}
+
+        def snippet(line_num: int, context_lines: int = 2) -> str:
+            key = (line_num, context_lines)
+            code = snippet_cache.get(key)
+            if code is None:
+                code = snippet_cache[key] = self.get_buffer_snippet(
+                    content, line_starts, line_num, context_lines
+                )
+            return code
+
         # Track parsing state
         current_class: Optional[str] = None
+        # Function whose body owns relationships on the current line. Only a
+        # new definition replaces it.
         current_function: Optional[FunctionContext] = None
-        class_variables: dict[str, str] = {}  # name -> node_id
+        # Function that is still open by indentation; while set, variable
+        # declarations are treated as function-local rather than class-level.
+        open_function: Optional[FunctionContext] = None
+        class_variables: dict[str, tuple[str, re.Pattern]] = {}  # name -> (node_id, write pattern)
         defined_signals: dict[str, str] = {}  # name -> node_id
         defined_functions: dict[str, str] = {}  # name -> node_id
 
-        # First pass: Extract definitions
+        # Relationships may point at functions, signals or variables declared
+        # further down the file, so edges are buffered during the pass and
+        # resolved once every definition is known. Entries are
+        # (source, target, relationship, context, confidence): a str endpoint
+        # is a node id, a (table, name) endpoint is looked up in that table
+        # and the edge is dropped if the name was never defined. A None
+        # relationship marks a line whose variable reads/writes are resolved
+        # afterwards; its target holds the stripped line.
+        pending_edges: list[tuple] = []
+        # Nodes found inside function bodies, kept after the definitions
+        body_nodes: list[ParsedNode] = []
+
+        # Bind hot-loop lookups to locals once per file
+        first_pass_match = self.FIRST_PASS_RE.match
+        group_base = self.FIRST_PASS_RE.groupindex
+        declaration_starts = self.DECLARATION_STARTS
+        patterns = self.PATTERNS
+        find_emit_new = patterns["signal_emit_new"].finditer
+        find_emit_old = patterns["signal_emit_old"].finditer
+        find_connect_new = patterns["signal_connect_new"].finditer
+        find_method_call = patterns["method_call"].finditer
+        find_preload = patterns["preload"].finditer
+        find_load = patterns["load"].finditer
+        find_dollar_path = patterns["dollar_path"].finditer
+        find_get_node = patterns["get_node"].finditer
+        find_dynamic_call = patterns["dynamic_call"].finditer
+        find_get_node_var = patterns["get_node_var"].finditer
+        builtin_functions = self.BUILTIN_FUNCTIONS
+
+        # Scan the whole buffer once per relationship pattern. A pattern that
+        # matches nowhere in the file cannot match any single line, so its
+        # per-line scan is skipped entirely.
+        present = {
+            name for name in self.RELATIONSHIP_PATTERNS
+            if patterns[name].search(content)
+        }
+        has_emit_new = "signal_emit_new" in present
+        has_emit_old = "signal_emit_old" in present
+        has_connect_new = "signal_connect_new" in present
+        has_method_call = "method_call" in present
+        has_preload = "preload" in present
+        has_load = "load" in present
+        has_dollar_path = "dollar_path" in present
+        has_get_node = "get_node" in present
+        has_dynamic_call = "dynamic_call" in present
+        has_get_node_var = "get_node_var" in present
+
+        # Single pass: definitions and relationships
         for line_num, line in enumerate(lines, 1):
             stripped = line.strip()
 
-            # Skip empty lines and comments
-            if not stripped or stripped.startswith("#"):
+            # Skip empty lines and comments (a non-empty line is tested by its
+            # first character rather than a startswith call)
+            if not stripped or stripped[0] == "#":
+                continue
+
+            # One combined match per line; dispatch on the alternative that hit.
+            # Lines that cannot start a declaration skip the regex call.
+            match = first_pass_match(stripped) if stripped[0] in declaration_starts else None
+            kind = match.lastgroup if match else None
+            g = group_base[kind] if match else 0
+
+            # Function definitions
+            if kind == "func_def" or kind == "static_func":
+                # Matched against the stripped line, so take indent from the raw line
+                indent = len(line) - len(line.lstrip())
+                func_name = match.group(g + 2)
+                params_str = match.group(g + 3) or ""
+                return_type = match.group(g + 4)
+
+                params = self._parse_params(params_str)
+                node_id = self.generate_node_id(NodeType.FUNCTION, file_path, func_name, line_num)
+                defined_functions[func_name] = node_id
+
+                node = ParsedNode(
+                    id=node_id,
+                    type=NodeType.FUNCTION,
+                    name=func_name,
+                    file_path=file_path_str,
+                    line_number=line_num,
+                    language=_LANGUAGE,
+                    code_snippet=snippet(line_num, context_lines=5),
+                    metadata={
+                        "params": params,
+                        "return_type": return_type,
+                        "is_static": "static" in line,
+                        "is_private": func_name.startswith("_"),
+                    }
+                )
+                result.nodes.append(node)
+
+                current_function = open_function = FunctionContext(
+                    name=func_name,
+                    node_id=node_id,
+                    start_line=line_num,
+                    indent_level=indent
+                )
                 continue
 
             # Class name
-            match = self.PATTERNS["class_name"].match(stripped)
-            if match:
-                current_class = match.group(1)
+            if kind == "class_name":
+                current_class = match.group(g + 1)
                 node = ParsedNode(
                     id=self.generate_node_id(NodeType.CLASS, file_path, current_class, line_num),
                     type=NodeType.CLASS,
                     name=current_class,
-                    file_path=str(file_path),
+                    file_path=file_path_str,
                     line_number=line_num,
-                    language="gdscript",
-                    code_snippet=self.get_code_snippet(lines, line_num),
+                    language=_LANGUAGE,
+                    code_snippet=snippet(line_num),
                     metadata={"is_class_name": True}
                 )
                 result.nodes.append(node)
-                continue
 
             # Extends
-            match = self.PATTERNS["extends"].match(stripped)
-            if match:
-                parent_class = match.group(1)
+            elif kind == "extends":
+                parent_class = match.group(g + 1)
                 if current_class:
                     # Add inheritance edge later when we have class node
                     result.edges.append(ParsedEdge(
@@ -180,13 +329,11 @@ class GDScriptParser(BaseParser):
                         context=f"extends {parent_class} (line {line_num})",
                         confidence=Confidence.MEDIUM  # May not resolve to actual class
                     ))
-                continue
 
             # Signal definitions
-            match = self.PATTERNS["signal_def"].match(stripped)
-            if match:
-                signal_name = match.group(1)
-                params_str = match.group(2) or ""
+            elif kind == "signal_def":
+                signal_name = match.group(g + 1)
+                params_str = match.group(g + 2) or ""
                 params = self._parse_params(params_str)
 
                 node_id = self.generate_node_id(NodeType.SIGNAL, file_path, signal_name, line_num)
@@ -196,274 +343,261 @@ class GDScriptParser(BaseParser):
                     id=node_id,
                     type=NodeType.SIGNAL,
                     name=signal_name,
-                    file_path=str(file_path),
+                    file_path=file_path_str,
                     line_number=line_num,
-                    language="gdscript",
-                    code_snippet=self.get_code_snippet(lines, line_num),
+                    language=_LANGUAGE,
+                    code_snippet=snippet(line_num),
                     metadata={"params": params}
                 )
                 result.nodes.append(node)
-                continue
-
-            # Function definitions
-            match = self.PATTERNS["func_def"].match(line) or self.PATTERNS["static_func"].match(line)
-            if match:
-                indent = len(match.group(1))
-                func_name = match.group(2)
-                params_str = match.group(3) or ""
-                return_type = match.group(4)
 
-                params = self._parse_params(params_str)
-                node_id = self.generate_node_id(NodeType.FUNCTION, file_path, func_name, line_num)
-                defined_functions[func_name] = node_id
-
-                node = ParsedNode(
-                    id=node_id,
-                    type=NodeType.FUNCTION,
-                    name=func_name,
-                    file_path=str(file_path),
-                    line_number=line_num,
-                    language="gdscript",
-                    code_snippet=self.get_code_snippet(lines, line_num, context_lines=5),
-                    metadata={
-                        "params": params,
-                        "return_type": return_type,
-                        "is_static": "static" in line,
-                        "is_private": func_name.startswith("_"),
-                    }
+            # Variable declarations (class-level)
+            elif open_function is None and kind in self.VARIABLE_PATTERNS:
+                var_node = self._parse_variable(
+                    kind, match.group(g + 1, g + 2, g + 3, g + 4), file_path, file_path_str, line_num,
+                    snippet(line_num)
                 )
-                result.nodes.append(node)
-
-                current_function = FunctionContext(
-                    name=func_name,
-                    node_id=node_id,
-                    start_line=line_num,
-                    indent_level=indent
+                var_name = var_node.name
+                # Names are captured by (\w+), so they need no escaping
+                class_variables[var_name] = (
+                    var_node.id,
+                    re.compile(rf'\b{var_name}\s*='),
                 )
-                continue
+                result.nodes.append(var_node)
 
-            # Variable declarations (class-level)
-            if current_function is None:
-                var_node = self._parse_variable(line, stripped, file_path, line_num, lines)
-                if var_node:
-                    class_variables[var_node.name] = var_node.id
-                    result.nodes.append(var_node)
-                    continue
-
-            # Check if we've exited current function (based on indentation)
-            if current_function and stripped and not line.startswith(" " * (current_function.indent_level + 1)):
-                if not stripped.startswith("#"):
-                    # Check if this is a new function or class-level code
-                    if self.PATTERNS["func_def"].match(line) or not line.startswith(" "):
-                        current_function = None
-
-        # Second pass: Extract relationships (calls, usage, emissions)
-        current_function = None
-
-        for line_num, line in enumerate(lines, 1):
-            stripped = line.strip()
-
-            if not stripped or stripped.startswith("#"):
-                continue
-
-            # Track function context
-            match = self.PATTERNS["func_def"].match(line) or self.PATTERNS["static_func"].match(line)
-            if match:
-                func_name = match.group(2)
-                if func_name in defined_functions:
-                    current_function = FunctionContext(
-                        name=func_name,
-                        node_id=defined_functions[func_name],
-                        start_line=line_num,
-                        indent_level=len(match.group(1))
-                    )
-                continue
+            # Check if we've exited current function (based on indentation).
+            # Only a line with no leading space counts as class-level code, so
+            # test the first character instead of building indent strings.
+            elif open_function and line[0] != " ":
+                open_function = None
 
             # Only process relationships inside functions
             if current_function is None:
                 continue
 
+            # Every relationship pattern except dollar_path needs a "(", and
+            # the new-style signal patterns also a "."; test the characters
+            # once so lines without them skip those regexes outright
+            has_paren = "(" in stripped
+            has_dot = has_paren and "." in stripped
+            # Literal keywords the resource/node/dynamic-call patterns contain
+            # ("preload" contains "load")
+            has_load_word = has_paren and "load" in stripped
+            has_get_node_word = has_paren and "get_node" in stripped
+
             # Signal emissions (new style: signal_name.emit())
-            for match in self.PATTERNS["signal_emit_new"].finditer(stripped):
-                signal_name = match.group(1)
-                if signal_name in defined_signals:
-                    result.edges.append(ParsedEdge(
-                        source_id=current_function.node_id,
-                        target_id=defined_signals[signal_name],
-                        relationship=EdgeType.EMITS,
-                        context=f"line {line_num}: {stripped[:60]}",
+            if has_emit_new and has_dot:
+                for match in find_emit_new(stripped):
+                    pending_edges.append((
+                        current_function.node_id,
+                        (defined_signals, match.group(1)),
+                        EdgeType.EMITS,
+                        f"line {line_num}: {stripped[:60]}",
+                        Confidence.HIGH,
                     ))
 
             # Signal emissions (old style: emit_signal("name"))
-            for match in self.PATTERNS["signal_emit_old"].finditer(stripped):
-                signal_name = match.group(1)
-                if signal_name in defined_signals:
-                    result.edges.append(ParsedEdge(
-                        source_id=current_function.node_id,
-                        target_id=defined_signals[signal_name],
-                        relationship=EdgeType.EMITS,
-                        context=f"line {line_num}: {stripped[:60]}",
+            if has_emit_old and has_paren:
+                for match in find_emit_old(stripped):
+                    pending_edges.append((
+                        current_function.node_id,
+                        (defined_signals, match.group(1)),
+                        EdgeType.EMITS,
+                        f"line {line_num}: {stripped[:60]}",
+                        Confidence.HIGH,
                     ))
 
             # Signal connections (new style: signal.connect(handler))
-            for match in self.PATTERNS["signal_connect_new"].finditer(stripped):
-                signal_name = match.group(1)
-                handler_name = match.group(2)
-
-                # Create connection node
-                conn_id = self.generate_node_id(
-                    NodeType.SIGNAL_CONNECTION, file_path, f"{signal_name}_to_{handler_name}", line_num
-                )
-                result.nodes.append(ParsedNode(
-                    id=conn_id,
-                    type=NodeType.SIGNAL_CONNECTION,
-                    name=f"{signal_name} -> {handler_name}",
-                    file_path=str(file_path),
-                    line_number=line_num,
-                    language="gdscript",
-                    code_snippet=self.get_code_snippet(lines, line_num),
-                    metadata={"signal": signal_name, "handler": handler_name}
-                ))
+            if has_connect_new and has_dot:
+                for match in find_connect_new(stripped):
+                    signal_name = match.group(1)
+                    handler_name = match.group(2)
+
+                    # Create connection node
+                    conn_id = self.generate_node_id(
+                        NodeType.SIGNAL_CONNECTION, file_path, f"{signal_name}_to_{handler_name}", line_num
+                    )
+                    body_nodes.append(ParsedNode(
+                        id=conn_id,
+                        type=NodeType.SIGNAL_CONNECTION,
+                        name=f"{signal_name} -> {handler_name}",
+                        file_path=file_path_str,
+                        line_number=line_num,
+                        language=_LANGUAGE,
+                        code_snippet=snippet(line_num),
+                        metadata={"signal": signal_name, "handler": handler_name}
+                    ))
 
-                # Connect signal to handler
-                if signal_name in defined_signals:
-                    result.edges.append(ParsedEdge(
-                        source_id=defined_signals[signal_name],
-                        target_id=conn_id,
-                        relationship=EdgeType.CONNECTS_TO,
-                        context=f"line {line_num}",
+                    # Connect signal to handler
+                    pending_edges.append((
+                        (defined_signals, signal_name),
+                        conn_id,
+                        EdgeType.CONNECTS_TO,
+                        f"line {line_num}",
+                        Confidence.HIGH,
                     ))
-                if handler_name in defined_functions:
-                    result.edges.append(ParsedEdge(
-                        source_id=conn_id,
-                        target_id=defined_functions[handler_name],
-                        relationship=EdgeType.CONNECTS_TO,
-                        context=f"line {line_num}",
+                    pending_edges.append((
+                        conn_id,
+                        (defined_functions, handler_name),
+                        EdgeType.CONNECTS_TO,
+                        f"line {line_num}",
+                        Confidence.HIGH,
                     ))
 
             # Function calls
-            for match in self.PATTERNS["method_call"].finditer(stripped):
-                called_func = match.group(1)
-
-                # Skip built-ins and self-calls
-                if called_func in self.BUILTIN_FUNCTIONS:
-                    continue
-                if called_func == current_function.name:
-                    continue
-
-                # Check if it's a known function
-                if called_func in defined_functions:
-                    result.edges.append(ParsedEdge(
-                        source_id=current_function.node_id,
-                        target_id=defined_functions[called_func],
-                        relationship=EdgeType.CALLS,
-                        context=f"line {line_num}: {stripped[:60]}",
+            if has_method_call and has_paren:
+                for match in find_method_call(stripped):
+                    called_func = match.group(1)
+
+                    # Skip built-ins and self-calls
+                    if called_func in builtin_functions:
+                        continue
+                    if called_func == current_function.name:
+                        continue
+
+                    pending_edges.append((
+                        current_function.node_id,
+                        (defined_functions, called_func),
+                        EdgeType.CALLS,
+                        f"line {line_num}: {stripped[:60]}",
+                        Confidence.HIGH,
                     ))
 
-            # Variable reads/writes
-            for var_name, var_id in class_variables.items():
-                if var_name in stripped:
-                    # Simple heuristic: if followed by = it's a write, otherwise read
-                    # This is simplified - real analysis would need AST
-                    pattern = rf'\b{re.escape(var_name)}\s*='
-                    if re.search(pattern, stripped) and not re.search(rf'==', stripped):
-                        result.edges.append(ParsedEdge(
-                            source_id=current_function.node_id,
-                            target_id=var_id,
-                            relationship=EdgeType.WRITES,
-                            context=f"line {line_num}",
-                            confidence=Confidence.MEDIUM
-                        ))
-                    elif re.search(rf'\b{re.escape(var_name)}\b', stripped):
-                        result.edges.append(ParsedEdge(
-                            source_id=current_function.node_id,
-                            target_id=var_id,
-                            relationship=EdgeType.READS,
-                            context=f"line {line_num}",
-                            confidence=Confidence.MEDIUM
-                        ))
+            # Variable reads/writes, classified once all class variables are known
+            pending_edges.append((
+                current_function.node_id, stripped, None, f"line {line_num}", Confidence.MEDIUM
+            ))
 
             # Resource loading
-            for match in self.PATTERNS["preload"].finditer(stripped):
-                res_path = match.group(1)
-                self._add_resource_reference(result, file_path, current_function.node_id, res_path, line_num, lines, "preload")
+            if has_preload and has_load_word and "preload" in stripped:
+                for match in find_preload(stripped):
+                    res_path = match.group(1)
+                    self._add_resource_reference(body_nodes, pending_edges, file_path, file_path_str, current_function.node_id, res_path, line_num, snippet(line_num), "preload")
 
-            for match in self.PATTERNS["load"].finditer(stripped):
-                res_path = match.group(1)
-                self._add_resource_reference(result, file_path, current_function.node_id, res_path, line_num, lines, "load")
+            if has_load and has_load_word:
+                for match in find_load(stripped):
+                    res_path = match.group(1)
+                    self._add_resource_reference(body_nodes, pending_edges, file_path, file_path_str, current_function.node_id, res_path, line_num, snippet(line_num), "load")
 
             # Node references
-            for match in self.PATTERNS["dollar_path"].finditer(stripped):
-                node_path = match.group(1)
-                self._add_node_reference(result, file_path, current_function.node_id, node_path, line_num, lines)
+            if has_dollar_path and "$" in stripped:
+                for match in find_dollar_path(stripped):
+                    node_path = match.group(1)
+                    self._add_node_reference(body_nodes, pending_edges, file_path, file_path_str, current_function.node_id, node_path, line_num, snippet(line_num))
 
-            for match in self.PATTERNS["get_node"].finditer(stripped):
-                node_path = match.group(1)
-                self._add_node_reference(result, file_path, current_function.node_id, node_path, line_num, lines)
+            if has_get_node and has_get_node_word:
+                for match in find_get_node(stripped):
+                    node_path = match.group(1)
+                    self._add_node_reference(body_nodes, pending_edges, file_path, file_path_str, current_function.node_id, node_path, line_num, snippet(line_num))
 
             # Dynamic calls (mark as ambiguous)
-            for match in self.PATTERNS["dynamic_call"].finditer(stripped):
-                method_name = match.group(1)
-                result.warnings.append(f"Dynamic call at line {line_num}: call(\"{method_name}\")")
-                result.nodes.append(ParsedNode(
-                    id=self.generate_node_id(NodeType.AMBIGUOUS, file_path, f"dynamic_call_{method_name}", line_num),
-                    type=NodeType.AMBIGUOUS,
-                    name=f"call(\"{method_name}\")",
-                    file_path=str(file_path),
-                    line_number=line_num,
-                    language="gdscript",
-                    code_snippet=self.get_code_snippet(lines, line_num),
-                    metadata={"reason": "dynamic_method_call", "method_name": method_name},
-                    confidence=Confidence.AMBIGUOUS
-                ))
+            if has_dynamic_call and has_paren and "call" in stripped:
+                for match in find_dynamic_call(stripped):
+                    method_name = match.group(1)
+                    result.warnings.append(f"Dynamic call at line {line_num}: call(\"{method_name}\")")
+                    body_nodes.append(ParsedNode(
+                        id=self.generate_node_id(NodeType.AMBIGUOUS, file_path, f"dynamic_call_{method_name}", line_num),
+                        type=NodeType.AMBIGUOUS,
+                        name=f"call(\"{method_name}\")",
+                        file_path=file_path_str,
+                        line_number=line_num,
+                        language=_LANGUAGE,
+                        code_snippet=snippet(line_num),
+                        metadata={"reason": "dynamic_method_call", "method_name": method_name},
+                        confidence=Confidence.AMBIGUOUS
+                    ))
 
             # Variable-based get_node (ambiguous)
-            for match in self.PATTERNS["get_node_var"].finditer(stripped):
-                var_name = match.group(1)
-                result.warnings.append(f"Variable node path at line {line_num}: get_node({var_name})")
+            if has_get_node_var and has_get_node_word:
+                for match in find_get_node_var(stripped):
+                    var_name = match.group(1)
+                    result.warnings.append(f"Variable node path at line {line_num}: get_node({var_name})")
+                    body_nodes.append(ParsedNode(
+                        id=self.generate_node_id(NodeType.AMBIGUOUS, file_path, f"dynamic_node_{var_name}", line_num),
+                        type=NodeType.AMBIGUOUS,
+                        name=f"get_node({var_name})",
+                        file_path=file_path_str,
+                        line_number=line_num,
+                        language=_LANGUAGE,
+                        code_snippet=snippet(line_num),
+                        metadata={"reason": "variable_node_path", "variable": var_name},
+                        confidence=Confidence.AMBIGUOUS
+                    ))
+
+        result.nodes.extend(body_nodes)
+
+        # A single alternation over all class variable names finds every
+        # whole-word reference on a line in one scan, instead of one
+        # substring test and up to two searches per variable. The names are
+        # plain identifiers, so they are joined without escaping.
+        var_order = {name: i for i, name in enumerate(class_variables)}
+        class_var_re = re.compile(
+            r"\b(?:" + "|".join(class_variables) + r")\b"
+        ) if class_variables else None
+
+        # Resolve buffered relationships now that every definition is known.
+        # Resolved edges stay plain tuples until the end of the pass.
+        resolved: list[tuple] = []
+        append_resolved = resolved.append
+        for source, target, relationship, context, confidence in pending_edges:
+            if relationship is None:
+                if class_var_re is None:
+                    continue
+                stripped = target
+                referenced = {m.group() for m in class_var_re.finditer(stripped)}
+                for var_name in sorted(referenced, key=var_order.__getitem__):
+                    var_id, write_re = class_variables[var_name]
+                    # Simple heuristic: if followed by = it's a write, otherwise read
+                    # This is simplified - real analysis would need AST
+                    if write_re.search(stripped) and "==" not in stripped:
+                        relationship = EdgeType.WRITES
+                    else:
+                        relationship = EdgeType.READS
+                    append_resolved((source, var_id, relationship, context, confidence))
+                continue
+
+            if type(source) is tuple:
+                source = source[0].get(source[1])
+            if type(target) is tuple:
+                target = target[0].get(target[1])
+            if source is not None and target is not None:
+                append_resolved((source, target, relationship, context, confidence))
+
+        # Materialize every edge in one go (fields in ParsedEdge order)
+        result.edges.extend([
+            ParsedEdge(source, target, relationship, context, {}, confidence)
+            for source, target, relationship, context, confidence in resolved
+        ])
+
+        # Also extract class-level preloads/loads (constants). Scan the whole
+        # buffer once and map match offsets back to line numbers, so only
+        # lines that actually declare a constant are visited.
+        for match in self.CONST_DECL_ALL.finditer(content):
+            const_name = match.group(1)
+            value = match.group(3) or ""
+
+            # Check for preload in value
+            preload_match = patterns["preload"].search(value)
+            if preload_match:
+                line_num = bisect_right(line_starts, match.start())
+                res_path = preload_match.group(1)
+                node_id = self.generate_node_id(NodeType.RESOURCE, file_path, const_name, line_num)
                 result.nodes.append(ParsedNode(
-                    id=self.generate_node_id(NodeType.AMBIGUOUS, file_path, f"dynamic_node_{var_name}", line_num),
-                    type=NodeType.AMBIGUOUS,
-                    name=f"get_node({var_name})",
-                    file_path=str(file_path),
+                    id=node_id,
+                    type=NodeType.RESOURCE,
+                    name=const_name,
+                    file_path=file_path_str,
                     line_number=line_num,
-                    language="gdscript",
-                    code_snippet=self.get_code_snippet(lines, line_num),
-                    metadata={"reason": "variable_node_path", "variable": var_name},
-                    confidence=Confidence.AMBIGUOUS
+                    language=_LANGUAGE,
+                    code_snippet=snippet(line_num),
+                    metadata={
+                        "resource_path": res_path,
+                        "load_type": "preload",
+                        "is_constant": True
+                    }
                 ))
 
-        # Also extract class-level preloads/loads (constants)
-        for line_num, line in enumerate(lines, 1):
-            stripped = line.strip()
-
-            # Constant preloads (class level)
-            match = self.PATTERNS["const_decl"].match(stripped)
-            if match:
-                const_name = match.group(2)
-                value = match.group(4) or ""
-
-                # Check for preload in value
-                preload_match = self.PATTERNS["preload"].search(value)
-                if preload_match:
-                    res_path = preload_match.group(1)
-                    node_id = self.generate_node_id(NodeType.RESOURCE, file_path, const_name, line_num)
-                    result.nodes.append(ParsedNode(
-                        id=node_id,
-                        type=NodeType.RESOURCE,
-                        name=const_name,
-                        file_path=str(file_path),
-                        line_number=line_num,
-                        language="gdscript",
-                        code_snippet=self.get_code_snippet(lines, line_num),
-                        metadata={
-                            "resource_path": res_path,
-                            "load_type": "preload",
-                            "is_constant": True
-                        }
-                    ))
-
-        return result
+        return self.cache_result(result)
 
     def _parse_params(self, params_str: str) -> list[dict]:
         """Parse function/signal parameters."""
@@ -488,73 +622,72 @@ class GDScriptParser(BaseParser):
 
     def _parse_variable(
         self,
-        line: str,
-        stripped: str,
+        pattern_name: str,
+        fields: tuple,
         file_path: Path,
+        file_path_str: str,
         line_num: int,
-        lines: list[str]
-    ) -> Optional[ParsedNode]:
-        """Parse a variable declaration."""
-        # Try different variable patterns
-        for pattern_name in ["export_var", "onready_var", "var_decl"]:
-            match = self.PATTERNS[pattern_name].match(stripped)
-            if match:
-                indent = match.group(1)
-                var_name = match.group(2)
-                var_type = match.group(3)
-                initial_value = match.group(4) if len(match.groups()) > 3 else None
-
-                # Determine scope based on indent
-                scope = "class" if len(indent) == 0 else "function"
-
-                metadata = {
-                    "type": var_type,
-                    "initial_value": initial_value[:50] if initial_value else None,
-                    "scope": scope,
-                    "is_exported": pattern_name == "export_var",
-                    "is_onready": pattern_name == "onready_var",
-                }
-
-                # Check for node reference in onready
-                if pattern_name == "onready_var" and initial_value:
-                    dollar_match = self.PATTERNS["dollar_path"].search(initial_value)
-                    if dollar_match:
-                        metadata["node_path"] = dollar_match.group(1)
-
-                return ParsedNode(
-                    id=self.generate_node_id(NodeType.VARIABLE, file_path, var_name, line_num),
-                    type=NodeType.VARIABLE,
-                    name=var_name,
-                    file_path=str(file_path),
-                    line_number=line_num,
-                    language="gdscript",
-                    code_snippet=self.get_code_snippet(lines, line_num),
-                    metadata=metadata
-                )
-
-        return None
+        code_snippet: str
+    ) -> ParsedNode:
+        """Build a variable node from a matched declaration.
+
+        Args:
+            pattern_name: Which of VARIABLE_PATTERNS matched
+            fields: The (indent, name, type, initial_value) groups of the match
+        """
+        indent, var_name, var_type, initial_value = fields
+
+        # Determine scope based on indent
+        scope = "class" if len(indent) == 0 else "function"
+
+        metadata = {
+            "type": var_type,
+            "initial_value": initial_value[:50] if initial_value else None,
+            "scope": scope,
+            "is_exported": pattern_name == "export_var",
+            "is_onready": pattern_name == "onready_var",
+        }
+
+        # Check for node reference in onready
+        if pattern_name == "onready_var" and initial_value:
+            dollar_match = self.PATTERNS["dollar_path"].search(initial_value)
+            if dollar_match:
+                metadata["node_path"] = dollar_match.group(1)
+
+        return ParsedNode(
+            id=self.generate_node_id(NodeType.VARIABLE, file_path, var_name, line_num),
+            type=NodeType.VARIABLE,
+            name=var_name,
+            file_path=file_path_str,
+            line_number=line_num,
+            language=_LANGUAGE,
+            code_snippet=code_snippet,
+            metadata=metadata
+        )
 
     def _add_resource_reference(
         self,
-        result: ParseResult,
+        nodes: list[ParsedNode],
+        edges: list[tuple],
         file_path: Path,
+        file_path_str: str,
         source_id: str,
         res_path: str,
         line_num: int,
-        lines: list[str],
+        code_snippet: str,
         load_type: str
     ) -> None:
-        """Add a resource reference node and edge."""
+        """Add a resource reference node and its (pending) edge."""
         node_id = self.generate_node_id(NodeType.RESOURCE, file_path, res_path.replace("/", "_"), line_num)
 
-        result.nodes.append(ParsedNode(
+        nodes.append(ParsedNode(
             id=node_id,
             type=NodeType.RESOURCE,
             name=res_path.split("/")[-1],
-            file_path=str(file_path),
+            file_path=file_path_str,
             line_number=line_num,
-            language="gdscript",
-            code_snippet=self.get_code_snippet(lines, line_num),
+            language=_LANGUAGE,
+            code_snippet=code_snippet,
             metadata={
                 "resource_path": res_path,
                 "load_type": load_type,
@@ -562,39 +695,43 @@ class GDScriptParser(BaseParser):
             }
         ))
 
-        result.edges.append(ParsedEdge(
-            source_id=source_id,
-            target_id=node_id,
-            relationship=EdgeType.REFERENCES,
-            context=f"{load_type}(\"{res_path}\") at line {line_num}"
+        edges.append((
+            source_id,
+            node_id,
+            EdgeType.REFERENCES,
+            f"{load_type}(\"{res_path}\") at line {line_num}",
+            Confidence.HIGH,
         ))
 
     def _add_node_reference(
         self,
-        result: ParseResult,
+        nodes: list[ParsedNode],
+        edges: list[tuple],
         file_path: Path,
+        file_path_str: str,
         source_id: str,
         node_path: str,
         line_num: int,
-        lines: list[str]
+        code_snippet: str
     ) -> None:
-        """Add a node reference and edge."""
+        """Add a node reference and its (pending) edge."""
         node_id = self.generate_node_id(NodeType.NODE_REFERENCE, file_path, node_path.replace("/", "_"), line_num)
 
-        result.nodes.append(ParsedNode(
+        nodes.append(ParsedNode(
             id=node_id,
             type=NodeType.NODE_REFERENCE,
             name=node_path.split("/")[-1],
-            file_path=str(file_path),
+            file_path=file_path_str,
             line_number=line_num,
-            language="gdscript",
-            code_snippet=self.get_code_snippet(lines, line_num),
+            language=_LANGUAGE,
+            code_snippet=code_snippet,
             metadata={"node_path": node_path}
         ))
 
-        result.edges.append(ParsedEdge(
-            source_id=source_id,
-            target_id=node_id,
-            relationship=EdgeType.REFERENCES,
-            context=f"${node_path} at line {line_num}"
+        edges.append((
+            source_id,
+            node_id,
+            EdgeType.REFERENCES,
+            f"${node_path} at line {line_num}",
+            Confidence.HIGH,
         ))
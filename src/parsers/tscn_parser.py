@@ -1,9 +1,11 @@
 """TSCN (Godot Scene) parser for extracting scene structure and relationships."""
 
 import re
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass
+from itertools import chain
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
 from .base_parser import (
     BaseParser,
@@ -16,7 +18,48 @@ from .base_parser import (
 )
 
 
-@dataclass
+_LANGUAGE = sys.intern("scene")
+
+# Context of the scene's CONTAINS edge to each of its tree nodes
+_CONTAINS_CTX = "Node in scene tree"
+
+# Type word of a bracketed section header, e.g. "node" in [node name=...]
+_SECTION_TYPE_RE = re.compile(r"\[(\w+)")
+
+# key=value attribute inside a section header. The value is either quoted
+# (group 2, unescaped quotes excluded) or bare up to whitespace or "]"
+# (group 3), e.g. format=3 or instance=ExtResource("1_abc").
+_ATTRIBUTE_RE = re.compile(r'(\w+)=(?:"((?:[^"\\]|\\.)*)"|([^\s\]]*))')
+
+
+def _tokenize(lines: Iterable[str]) -> Iterator[tuple[int, Optional[str], str]]:
+    """Scan TSCN lines into (line number, section type, stripped line) events.
+
+    Section type is the word after "[" for header lines and None for
+    property lines. Blank lines and value continuation lines (array items,
+    closing brackets) produce no event.
+    """
+    section_type = _SECTION_TYPE_RE.match
+    for line_num, line in enumerate(lines, 1):
+        # Blank lines separate every section; skip them without stripping.
+        # Text mode has already turned "\r\n" into "\n".
+        if line == "\n":
+            continue
+        stripped = line.strip()
+        if not stripped:
+            continue
+
+        first_char = stripped[0]
+        if first_char == "[":
+            match = section_type(stripped)
+            if match:
+                yield line_num, match.group(1), stripped
+        # Property lines start with a word character and contain "="
+        elif (first_char.isalnum() or first_char == "_") and "=" in stripped:
+            yield line_num, None, stripped
+
+
+@dataclass(slots=True)
 class ExtResource:
     """Represents an external resource reference in a TSCN file."""
     id: str
@@ -25,67 +68,21 @@ class ExtResource:
     uid: Optional[str] = None
 
 
-@dataclass
-class SceneNode:
-    """Represents a node in the scene tree."""
-    name: str
-    type: str
-    parent: Optional[str] = None
-    instance: Optional[str] = None  # ExtResource ID for instanced scenes
-    script: Optional[str] = None  # ExtResource ID for attached script
-    properties: dict = field(default_factory=dict)
-    line_number: int = 0
-
-
 class TSCNParser(BaseParser):
     """Parser for Godot scene files (.tscn)."""
 
     # Regex patterns for TSCN format
     PATTERNS = {
-        # Scene header
-        "scene_header": re.compile(
-            r'\[gd_scene\s+load_steps=(\d+)\s+format=(\d+)(?:\s+uid="([^"]+)")?\]'
-        ),
-
-        # External resources
-        "ext_resource": re.compile(
-            r'\[ext_resource\s+type="([^"]+)"(?:\s+uid="([^"]+)")?\s+path="([^"]+)"\s+id="([^"]+)"\]'
-        ),
-        # Alternative format (type at end)
-        "ext_resource_alt": re.compile(
-            r'\[ext_resource\s+path="([^"]+)"\s+type="([^"]+)"\s+id="([^"]+)"\]'
-        ),
-
         # Sub-resources (internal)
         "sub_resource": re.compile(
             r'\[sub_resource\s+type="([^"]+)"\s+id="([^"]+)"\]'
         ),
 
-        # Node definitions
-        "node": re.compile(
-            r'\[node\s+name="([^"]+)"\s+type="([^"]+)"(?:\s+parent="([^"]*)")?\]'
-        ),
-        "node_instance": re.compile(
-            r'\[node\s+name="([^"]+)"(?:\s+parent="([^"]*)")?\s+instance=ExtResource\("([^"]+)"\)\]'
-        ),
-        "node_instance_alt": re.compile(
-            r'\[node\s+name="([^"]+)"\s+instance=ExtResource\("([^"]+)"\)(?:\s+parent="([^"]*)")?\]'
-        ),
-
         # Script attachment
         "script_attach": re.compile(
             r'script\s*=\s*ExtResource\("([^"]+)"\)'
         ),
 
-        # Signal connections
-        "connection": re.compile(
-            r'\[connection\s+signal="([^"]+)"\s+from="([^"]+)"\s+to="([^"]+)"\s+method="([^"]+)"\]'
-        ),
-        # Connection with flags
-        "connection_flags": re.compile(
-            r'\[connection\s+signal="([^"]+)"\s+from="([^"]+)"\s+to="([^"]+)"\s+method="([^"]+)"\s+flags=(\d+)\]'
-        ),
-
         # Property assignments
         "property": re.compile(
             r'^(\w+)\s*=\s*(.+)$'
@@ -102,155 +99,168 @@ class TSCNParser(BaseParser):
 
     def parse_file(self, file_path: Path) -> ParseResult:
         """Parse a TSCN scene file and extract structure and relationships."""
+        # One shared string per file for every node's file_path
+        file_path_str = sys.intern(str(file_path))
         result = ParseResult(
-            file_path=str(file_path),
-            file_hash=self.compute_file_hash(file_path),
+            file_path=file_path_str,
+            file_hash="",
         )
 
         try:
-            content = file_path.read_text(encoding="utf-8")
-            lines = content.splitlines()
+            result.file_hash, lines = self.read_lines_for_parse(file_path)
+            # The first line doubles as the scene node's snippet
+            first_line = next(lines, "")
         except Exception as e:
             result.errors.append(f"Failed to read file: {e}")
             return result
 
+        # Unchanged since the last parse
+        cached = self.get_cached_result(result.file_path, result.file_hash)
+        if cached is not None:
+            return cached
+
         # Parse state
         ext_resources: dict[str, ExtResource] = {}
-        scene_nodes: list[SceneNode] = []
-        current_node: Optional[SceneNode] = None
+        # Scene tree node whose block is being read, as
+        # (name, type, parent, instance ExtResource ID, line number). Its graph
+        # nodes are emitted when the next node starts or the file ends, once
+        # its script and properties are known.
+        current_node: Optional[tuple] = None
+        current_script: Optional[str] = None  # ExtResource ID for attached script
+        current_properties: Optional[dict] = None  # Allocated on the first property
         scene_uid: Optional[str] = None
 
+        # Graph nodes and edges of the scene tree, added after the loop
+        tree_nodes: list[ParsedNode] = []
+        tree_edges: list[ParsedEdge] = []
+        # Scene tree node ids, for the scene's CONTAINS edges
+        contained_ids: list[str] = []
+        # Resource nodes emitted so far: (resource type, path) -> node_id.
+        # Nodes sharing a script or instanced scene all point at one node.
+        resource_nodes: dict[tuple[str, str], str] = {}
+        # Nodes referencing an ext_resource declared further down the file
+        deferred_nodes: list[tuple] = []
+
         # Create scene node for the file itself
+        rel_path = self.get_relative_path(file_path)
         scene_name = file_path.stem
         scene_node_id = self.generate_node_id(NodeType.SCENE, file_path, scene_name, 1)
 
-        result.nodes.append(ParsedNode(
+        scene_parsed_node = ParsedNode(
             id=scene_node_id,
             type=NodeType.SCENE,
             name=scene_name,
-            file_path=str(file_path),
+            file_path=file_path_str,
             line_number=1,
-            language="scene",
-            code_snippet=lines[0] if lines else "",
+            language=_LANGUAGE,
+            code_snippet=first_line.rstrip("\n"),
             metadata={
-                "scene_path": self.get_relative_path(file_path),
-                "godot_path": f"res://{self.get_relative_path(file_path)}"
+                "scene_path": rel_path,
+                "godot_path": f"res://{rel_path}"
             }
-        ))
+        )
+        result.nodes.append(scene_parsed_node)
+
+        # Emit a finished node right away, unless it references an
+        # ext_resource that has not been declared yet
+        def finish_node(scene_node: tuple) -> None:
+            instance, script = scene_node[3], scene_node[5]
+            if (instance and instance not in ext_resources) or (script and script not in ext_resources):
+                deferred_nodes.append(scene_node)
+            else:
+                contained_ids.append(self._add_scene_node(
+                    tree_nodes, tree_edges, resource_nodes, ext_resources,
+                    file_path, file_path_str, scene_node_id, scene_node
+                ))
 
-        for line_num, line in enumerate(lines, 1):
-            stripped = line.strip()
+        # Bind hot-loop lookups to locals once per file
+        attribute_findall = _ATTRIBUTE_RE.findall
+        ext_resource_ref_match = self.PATTERNS["ext_resource_ref"].match
+        script_attach_search = self.PATTERNS["script_attach"].search
+        property_match = self.PATTERNS["property"].match
 
-            if not stripped:
-                continue
+        for line_num, section, stripped in _tokenize(chain((first_line,), lines)):
+            # Property lines belong to the node being read
+            if section is None:
+                if current_node is None:
+                    continue
 
-            # Scene header
-            match = self.PATTERNS["scene_header"].match(stripped)
-            if match:
-                scene_uid = match.group(3)
-                result.nodes[0].metadata["uid"] = scene_uid
-                result.nodes[0].metadata["load_steps"] = int(match.group(1))
-                result.nodes[0].metadata["format"] = int(match.group(2))
-                continue
+                # Script attachment
+                match = script_attach_search(stripped)
+                if match:
+                    current_script = match.group(1)
+                    continue
 
-            # External resources
-            match = self.PATTERNS["ext_resource"].match(stripped)
-            if match:
-                res_type = match.group(1)
-                res_uid = match.group(2)
-                res_path = match.group(3)
-                res_id = match.group(4)
-
-                ext_resources[res_id] = ExtResource(
-                    id=res_id,
-                    type=res_type,
-                    path=res_path,
-                    uid=res_uid
-                )
+                # Other properties
+                match = property_match(stripped)
+                if match:
+                    prop_name = match.group(1)
+                    prop_value = match.group(2)
+                    if current_properties is None:
+                        current_properties = {}
+                    current_properties[prop_name] = prop_value
                 continue
 
-            # Alternative ext_resource format
-            match = self.PATTERNS["ext_resource_alt"].match(stripped)
-            if match:
-                res_path = match.group(1)
-                res_type = match.group(2)
-                res_id = match.group(3)
-
-                ext_resources[res_id] = ExtResource(
-                    id=res_id,
-                    type=res_type,
-                    path=res_path
-                )
-                continue
+            # Header lines: every attribute in one scan, in any order
+            attrs = {
+                key: quoted or bare
+                for key, quoted, bare in attribute_findall(stripped, len(section) + 1)
+            }
 
-            # Node definitions
-            match = self.PATTERNS["node"].match(stripped)
-            if match:
-                node_name = match.group(1)
-                node_type = match.group(2)
-                parent = match.group(3)
-
-                current_node = SceneNode(
-                    name=node_name,
-                    type=node_type,
-                    parent=parent if parent else None,
-                    line_number=line_num
-                )
-                scene_nodes.append(current_node)
+            # Scene header
+            if section == "gd_scene":
+                scene_uid = attrs.get("uid")
+                load_steps = attrs.get("load_steps")
+                scene_format = attrs.get("format")
+                scene_meta = scene_parsed_node.metadata
+                scene_meta["uid"] = scene_uid
+                scene_meta["load_steps"] = int(load_steps) if load_steps else None
+                scene_meta["format"] = int(scene_format) if scene_format else None
                 continue
 
-            # Node instances
-            match = self.PATTERNS["node_instance"].match(stripped) or self.PATTERNS["node_instance_alt"].match(stripped)
-            if match:
-                groups = match.groups()
-                # Handle both orderings
-                if len(groups) == 3:
-                    if groups[1] and groups[1].startswith("res://"):
-                        # Alt format: name, instance, parent
-                        node_name = groups[0]
-                        instance_id = groups[1]
-                        parent = groups[2]
-                    else:
-                        # Standard format: name, parent, instance
-                        node_name = groups[0]
-                        parent = groups[1]
-                        instance_id = groups[2]
-                else:
-                    node_name = groups[0]
-                    parent = groups[1] if len(groups) > 1 else None
-                    instance_id = groups[2] if len(groups) > 2 else None
-
-                current_node = SceneNode(
-                    name=node_name,
-                    type="(instance)",
-                    parent=parent if parent else None,
-                    instance=instance_id,
-                    line_number=line_num
-                )
-                scene_nodes.append(current_node)
+            # External resources
+            if section == "ext_resource":
+                res_id = attrs.get("id")
+                res_path = attrs.get("path")
+                if res_id and res_path:
+                    ext_resources[res_id] = ExtResource(
+                        id=res_id,
+                        type=attrs.get("type", ""),
+                        path=res_path,
+                        uid=attrs.get("uid")
+                    )
                 continue
 
-            # Script attachment (inside node properties)
-            if current_node:
-                match = self.PATTERNS["script_attach"].search(stripped)
-                if match:
-                    current_node.script = match.group(1)
+            # Node definitions and instances
+            if section == "node":
+                node_name = attrs.get("name")
+                instance_ref = ext_resource_ref_match(attrs.get("instance", ""))
+                if instance_ref:
+                    node_type = "(instance)"
+                    instance_id = instance_ref.group(1)
+                else:
+                    node_type = attrs.get("type")
+                    instance_id = None
+                if not node_name or not node_type:
                     continue
 
-                # Other properties
-                match = self.PATTERNS["property"].match(stripped)
-                if match and not stripped.startswith("["):
-                    prop_name = match.group(1)
-                    prop_value = match.group(2)
-                    current_node.properties[prop_name] = prop_value
+                # The previous node's block ends here
+                if current_node is not None:
+                    finish_node((*current_node, current_script, current_properties))
+
+                parent = attrs.get("parent")
+                current_node = (node_name, node_type, parent if parent else None, instance_id, line_num)
+                current_script = current_properties = None
+                continue
 
             # Signal connections
-            match = self.PATTERNS["connection"].match(stripped) or self.PATTERNS["connection_flags"].match(stripped)
-            if match:
-                signal_name = match.group(1)
-                from_node = match.group(2)
-                to_node = match.group(3)
-                method_name = match.group(4)
+            if section == "connection":
+                signal_name = attrs.get("signal")
+                from_node = attrs.get("from")
+                to_node = attrs.get("to")
+                method_name = attrs.get("method")
+                if not (signal_name and from_node and to_node and method_name):
+                    continue
 
                 # Create connection node
                 conn_id = self.generate_node_id(
@@ -264,9 +274,9 @@ class TSCNParser(BaseParser):
                     id=conn_id,
                     type=NodeType.SIGNAL_CONNECTION,
                     name=f"{from_node}.{signal_name} -> {to_node}.{method_name}",
-                    file_path=str(file_path),
+                    file_path=file_path_str,
                     line_number=line_num,
-                    language="scene",
+                    language=_LANGUAGE,
                     code_snippet=stripped,
                     metadata={
                         "signal": signal_name,
@@ -282,152 +292,195 @@ class TSCNParser(BaseParser):
                     source_id=scene_node_id,
                     target_id=conn_id,
                     relationship=EdgeType.CONTAINS,
-                    context=f"Scene connection at line {line_num}"
+                    context="Scene connection at line " + str(line_num)
                 ))
 
-        # Process scene nodes to create graph nodes and edges
-        for scene_node in scene_nodes:
-            node_id = self.generate_node_id(
-                NodeType.NODE_REFERENCE,
-                file_path,
-                scene_node.name,
-                scene_node.line_number
-            )
+        if current_node is not None:
+            finish_node((*current_node, current_script, current_properties))
+
+        # Every ext_resource is known now
+        for scene_node in deferred_nodes:
+            contained_ids.append(self._add_scene_node(
+                tree_nodes, tree_edges, resource_nodes, ext_resources,
+                file_path, file_path_str, scene_node_id, scene_node
+            ))
 
-            # Determine actual type for instances
-            actual_type = scene_node.type
-            instanced_scene_path = None
+        result.nodes.extend(tree_nodes)
+        # Edges: Scene contains each tree node
+        contains = EdgeType.CONTAINS
+        result.edges.extend([
+            ParsedEdge(scene_node_id, node_id, contains, _CONTAINS_CTX)
+            for node_id in contained_ids
+        ])
+        result.edges.extend(tree_edges)
 
-            if scene_node.instance and scene_node.instance in ext_resources:
-                ext_res = ext_resources[scene_node.instance]
-                instanced_scene_path = ext_res.path
-                actual_type = f"instance of {ext_res.path.split('/')[-1]}"
+        # Create external resource references
+        for ext_id, ext_res in ext_resources.items():
+            # Skip scripts (already handled above)
+            if ext_res.type == "Script":
+                continue
+
+            res_node_id = self.generate_node_id(
+                NodeType.RESOURCE,
+                file_path,
+                f"ext_{ext_id}_{ext_res.path.replace('/', '_')}",
+                1
+            )
 
             result.nodes.append(ParsedNode(
-                id=node_id,
-                type=NodeType.NODE_REFERENCE,
-                name=scene_node.name,
-                file_path=str(file_path),
-                line_number=scene_node.line_number,
-                language="scene",
-                code_snippet=f"[node name=\"{scene_node.name}\" type=\"{scene_node.type}\"]",
+                id=res_node_id,
+                type=NodeType.RESOURCE,
+                name=ext_res.path.rpartition("/")[2],
+                file_path=file_path_str,
+                line_number=1,
+                language=_LANGUAGE,
+                code_snippet="",
                 metadata={
-                    "node_type": scene_node.type,
-                    "parent_path": scene_node.parent,
-                    "is_instance": scene_node.instance is not None,
-                    "instanced_scene": instanced_scene_path,
-                    "properties": scene_node.properties
+                    "resource_path": ext_res.path,
+                    "resource_type": ext_res.type,
+                    "ext_resource_id": ext_id,
+                    "uid": ext_res.uid
                 }
             ))
 
-            # Edge: Scene contains this node
             result.edges.append(ParsedEdge(
                 source_id=scene_node_id,
-                target_id=node_id,
-                relationship=EdgeType.CONTAINS,
-                context=f"Node in scene tree"
+                target_id=res_node_id,
+                relationship=EdgeType.REFERENCES,
+                context=f"External resource: {ext_res.type}"
             ))
 
-            # Edge: Script attachment
-            if scene_node.script and scene_node.script in ext_resources:
-                script_res = ext_resources[scene_node.script]
-                script_path = script_res.path
+        return self.cache_result(result)
+
+    def _add_scene_node(
+        self,
+        nodes: list[ParsedNode],
+        edges: list[ParsedEdge],
+        resource_nodes: dict[tuple[str, str], str],
+        ext_resources: dict[str, ExtResource],
+        file_path: Path,
+        file_path_str: str,
+        scene_node_id: str,
+        scene_node: tuple
+    ) -> str:
+        """Add a scene tree node with its script and instanced scene.
+
+        The scene's CONTAINS edge to the node is left to the caller.
+
+        Args:
+            resource_nodes: Resource nodes already added, by (type, path)
+            scene_node: (name, type, parent, instance, line number, script,
+                properties) of the node
+
+        Returns:
+            ID of the added node
+        """
+        node_name, node_type, parent, instance, node_line, script, properties = scene_node
+
+        node_id = self.generate_node_id(
+            NodeType.NODE_REFERENCE,
+            file_path,
+            node_name,
+            node_line
+        )
 
-                # Create resource node for the script
+        # Determine actual type for instances
+        actual_type = node_type
+        instanced_scene_path = None
+
+        ext_res = ext_resources.get(instance) if instance else None
+        if ext_res:
+            instanced_scene_path = ext_res.path
+            actual_type = f"instance of {ext_res.path.rpartition('/')[2]}"
+
+        nodes.append(ParsedNode(
+            id=node_id,
+            type=NodeType.NODE_REFERENCE,
+            name=node_name,
+            file_path=file_path_str,
+            line_number=node_line,
+            language=_LANGUAGE,
+            code_snippet=f"[node name=\"{node_name}\" type=\"{node_type}\"]",
+            metadata={
+                "node_type": node_type,
+                "parent_path": parent,
+                "is_instance": instance is not None,
+                "instanced_scene": instanced_scene_path,
+                "properties": properties or {}
+            }
+        ))
+
+        # Edge: Script attachment
+        script_res = ext_resources.get(script) if script else None
+        if script_res:
+            script_path = script_res.path
+
+            # Create resource node for the script, once per script
+            script_key = ("Script", script_path)
+            script_node_id = resource_nodes.get(script_key)
+            if script_node_id is None:
                 script_node_id = self.generate_node_id(
                     NodeType.RESOURCE,
                     file_path,
                     script_path.replace("/", "_"),
-                    scene_node.line_number
+                    node_line
                 )
+                resource_nodes[script_key] = script_node_id
 
-                result.nodes.append(ParsedNode(
+                nodes.append(ParsedNode(
                     id=script_node_id,
                     type=NodeType.RESOURCE,
-                    name=script_path.split("/")[-1],
-                    file_path=str(file_path),
-                    line_number=scene_node.line_number,
-                    language="scene",
+                    name=script_path.rpartition("/")[2],
+                    file_path=file_path_str,
+                    line_number=node_line,
+                    language=_LANGUAGE,
                     code_snippet="",
                     metadata={
                         "resource_path": script_path,
                         "resource_type": "Script",
-                        "attached_to_node": scene_node.name
-                    }
-                ))
-
-                result.edges.append(ParsedEdge(
-                    source_id=node_id,
-                    target_id=script_node_id,
-                    relationship=EdgeType.ATTACHES_TO,
-                    context=f"Script attached to {scene_node.name}"
-                ))
-
-            # Edge: Scene instantiation
-            if instanced_scene_path:
-                instanced_node_id = self.generate_node_id(
-                    NodeType.RESOURCE,
-                    file_path,
-                    instanced_scene_path.replace("/", "_"),
-                    scene_node.line_number
-                )
-
-                result.nodes.append(ParsedNode(
-                    id=instanced_node_id,
-                    type=NodeType.RESOURCE,
-                    name=instanced_scene_path.split("/")[-1],
-                    file_path=str(file_path),
-                    line_number=scene_node.line_number,
-                    language="scene",
-                    code_snippet="",
-                    metadata={
-                        "resource_path": instanced_scene_path,
-                        "resource_type": "PackedScene",
-                        "instanced_as": scene_node.name
+                        "attached_to_node": node_name
                     }
                 ))
 
-                result.edges.append(ParsedEdge(
-                    source_id=scene_node_id,
-                    target_id=instanced_node_id,
-                    relationship=EdgeType.INSTANTIATES,
-                    context=f"Scene instances {instanced_scene_path}"
-                ))
-
-        # Create external resource references
-        for ext_id, ext_res in ext_resources.items():
-            # Skip scripts (already handled above)
-            if ext_res.type == "Script":
-                continue
+            edges.append(ParsedEdge(
+                source_id=node_id,
+                target_id=script_node_id,
+                relationship=EdgeType.ATTACHES_TO,
+                context=f"Script attached to {node_name}"
+            ))
 
-            res_node_id = self.generate_node_id(
+        # Edge: Scene instantiation. The edge runs from the scene itself,
+        # so it is only added once per instanced scene with its node.
+        instance_key = ("PackedScene", instanced_scene_path)
+        if instanced_scene_path and instance_key not in resource_nodes:
+            instanced_node_id = self.generate_node_id(
                 NodeType.RESOURCE,
                 file_path,
-                f"ext_{ext_id}_{ext_res.path.replace('/', '_')}",
-                1
+                instanced_scene_path.replace("/", "_"),
+                node_line
             )
+            resource_nodes[instance_key] = instanced_node_id
 
-            result.nodes.append(ParsedNode(
-                id=res_node_id,
+            nodes.append(ParsedNode(
+                id=instanced_node_id,
                 type=NodeType.RESOURCE,
-                name=ext_res.path.split("/")[-1],
-                file_path=str(file_path),
-                line_number=1,
-                language="scene",
+                name=instanced_scene_path.rpartition("/")[2],
+                file_path=file_path_str,
+                line_number=node_line,
+                language=_LANGUAGE,
                 code_snippet="",
                 metadata={
-                    "resource_path": ext_res.path,
-                    "resource_type": ext_res.type,
-                    "ext_resource_id": ext_id,
-                    "uid": ext_res.uid
+                    "resource_path": instanced_scene_path,
+                    "resource_type": "PackedScene",
+                    "instanced_as": node_name
                 }
             ))
 
-            result.edges.append(ParsedEdge(
+            edges.append(ParsedEdge(
                 source_id=scene_node_id,
-                target_id=res_node_id,
-                relationship=EdgeType.REFERENCES,
-                context=f"External resource: {ext_res.type}"
+                target_id=instanced_node_id,
+                relationship=EdgeType.INSTANTIATES,
+                context=f"Scene instances {instanced_scene_path}"
             ))
 
-        return result
+        return node_id
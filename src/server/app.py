@@ -1,10 +1,19 @@
 """Flask web server for REACH Code Visualizer."""
 
+import heapq
+import linecache
 import os
 import re
+import threading
+import zlib
+from array import array
+from collections import Counter, defaultdict
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-from flask import Flask, jsonify, request, send_from_directory
+from typing import Iterable, Iterator, Optional
+import orjson
+from flask import Flask, Response, request, send_from_directory
+from flask_compress import Compress
 from flask_cors import CORS
 
 import sys
@@ -12,6 +21,55 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.graph import GraphBuilder, GraphQueries
 from src.analyzers import FlowTracer, DependencyAnalyzer
+from src.utils.config import config
+
+
+# Natural-language query forms understood by /api/query
+# "show path from X to Y" or "path X to Y"
+_PATH_QUERY_RE = re.compile(r"(?:show\s+)?path\s+(?:from\s+)?['\"]?(\w+)['\"]?\s+(?:to\s+)?['\"]?(\w+)['\"]?")
+# "where is X used?" or "what uses X?"
+_USAGE_QUERY_RE = re.compile(r"(?:where\s+is\s+)?['\"]?(\w+)['\"]?\s+used|what\s+uses\s+['\"]?(\w+)['\"]?")
+# "what calls X?"
+_CALLERS_QUERY_RE = re.compile(r"what\s+calls\s+['\"]?(\w+)['\"]?")
+# "trace signal X"
+_SIGNAL_QUERY_RE = re.compile(r"(?:trace\s+)?signal\s+['\"]?(\w+)['\"]?")
+_WORD_RE = re.compile(r"\b\w+\b")
+
+
+@lru_cache(maxsize=8192)
+def _short_path(file_path: str) -> str:
+    """Shorten file path for display."""
+    if not file_path:
+        return ""
+    for prefix in ["F:/Reach/", "F:\\Reach\\", "/", "\\"]:
+        if file_path.startswith(prefix):
+            file_path = file_path[len(prefix):]
+            break
+    return file_path.replace("\\", "/")
+
+
+def _gzip_stream(chunks: Iterable[bytes], level: int, batch: int = 256) -> Iterator[bytes]:
+    """Gzip a byte stream as it is produced.
+
+    The compressor is sync-flushed every ``batch`` chunks so the client
+    keeps receiving data without a flush (and its overhead) per chunk.
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # 31: gzip wrapper
+    pending = 0
+    for chunk in chunks:
+        out = compressor.compress(chunk)
+        pending += 1
+        if pending >= batch:
+            out += compressor.flush(zlib.Z_SYNC_FLUSH)
+            pending = 0
+        if out:
+            yield out
+    yield compressor.flush()
+
+
+def _json(obj) -> Response:
+    """Serialize obj to a JSON response with orjson."""
+    return Response(orjson.dumps(obj), mimetype="application/json")
 
 
 def create_app(scan_path: str = "F:/Reach") -> Flask:
@@ -19,36 +77,186 @@ def create_app(scan_path: str = "F:/Reach") -> Flask:
     app = Flask(__name__, static_folder=None)
     CORS(app)
 
+    # Compress JSON responses for clients that accept gzip/brotli.
+    # /api/graph gzips its own stream; Flask-Compress only sees its
+    # buffered form, sent to clients that do not accept gzip.
+    app.config["COMPRESS_MIMETYPES"] = ["application/json", "application/x-ndjson"]
+    app.config["COMPRESS_LEVEL"] = 6
+    app.config["COMPRESS_STREAMS"] = False
+
+    # Let browsers reuse static assets instead of re-requesting them. With
+    # x_sendfile, a front server (nginx, Apache) sends the file bytes.
+    static_max_age = config.get("server.static_max_age", 86400)
+    app.use_x_sendfile = config.get("server.x_sendfile", False)
+    Compress(app)
+
     # Store graph data in app context
     app.config["SCAN_PATH"] = scan_path
+    # Rich console output for the graph builder's logs
+    app.config["RICH_LOGGING"] = False
     app.config["GRAPH_BUILDER"] = None
     app.config["GRAPH_QUERIES"] = None
     app.config["FLOW_TRACER"] = None
     app.config["DEPENDENCY_ANALYZER"] = None
+    app.config["NODE_SOA"] = None
+    app.config["STATS_CACHE"] = None
+    app.config["GRAPH_CSR"] = None
 
     frontend_path = Path(__file__).parent.parent.parent / "frontend"
+    build_lock = threading.Lock()
 
     def get_builder() -> GraphBuilder:
         """Get or create graph builder."""
         if app.config["GRAPH_BUILDER"] is None:
-            builder_config = {
-                "exclude_patterns": [
-                    "**/node_modules/**",
-                    "**/.godot/**",
-                    "**/build/**",
-                    "**/.git/**",
-                    "**/addons/**",
-                    "**/tools/data-visualizer/**"
-                ]
-            }
-            builder = GraphBuilder(app.config["SCAN_PATH"], builder_config)
-            builder.build_graph()
-            app.config["GRAPH_BUILDER"] = builder
-            app.config["GRAPH_QUERIES"] = GraphQueries(builder.graph)
-            app.config["FLOW_TRACER"] = FlowTracer(builder.graph, app.config["GRAPH_QUERIES"])
-            app.config["DEPENDENCY_ANALYZER"] = DependencyAnalyzer(builder.graph, app.config["GRAPH_QUERIES"])
+            # Concurrent first requests wait for one build instead of each scanning
+            with build_lock:
+                if app.config["GRAPH_BUILDER"] is None:
+                    builder_config = {
+                        "rich_output": app.config["RICH_LOGGING"],
+                        "exclude_patterns": [
+                            "**/node_modules/**",
+                            "**/.godot/**",
+                            "**/build/**",
+                            "**/.git/**",
+                            "**/addons/**",
+                            "**/tools/data-visualizer/**"
+                        ]
+                    }
+                    builder = GraphBuilder(app.config["SCAN_PATH"], builder_config)
+                    builder.build_graph()
+                    app.config["GRAPH_QUERIES"] = GraphQueries(builder.graph)
+                    app.config["FLOW_TRACER"] = FlowTracer(builder.graph, app.config["GRAPH_QUERIES"])
+                    app.config["DEPENDENCY_ANALYZER"] = DependencyAnalyzer(builder.graph, app.config["GRAPH_QUERIES"])
+                    app.config["NODE_SOA"] = build_node_soa(builder.graph)
+                    app.config["STATS_CACHE"] = build_stats(builder.graph, app.config["NODE_SOA"])
+                    app.config["GRAPH_CSR"] = build_graph_csr(builder.graph, app.config["NODE_SOA"]["ids"])
+                    node_view.cache_clear()
+                    # Set last: other threads skip the lock once this is set
+                    app.config["GRAPH_BUILDER"] = builder
         return app.config["GRAPH_BUILDER"]
 
+    def build_node_soa(graph) -> dict:
+        """Project node attributes into parallel lists, one entry per node.
+
+        Endpoints that walk every node index these lists instead of pulling
+        the same attributes out of each node's data dict on every request.
+        Type and lowercased language buckets hold the indices of the nodes
+        with each value, so filtered requests only visit matching nodes.
+        Trigrams maps each three-character slice of a lowercased name or ID
+        to the indices of the nodes containing it, for /api/search.
+        """
+        ids = []
+        names = []
+        names_lower = []
+        ids_lower = []
+        types = []
+        files = []
+        lines = []
+        langs = []
+        # Language as counted by /api/stats: "unknown" only when missing
+        stats_langs = []
+        confs = []
+        type_buckets = defaultdict(list)
+        lang_buckets = defaultdict(list)
+        trigrams = defaultdict(list)
+        for i, (node_id, data) in enumerate(graph.nodes(data=True)):
+            ids.append(node_id)
+            names.append(data.get("name", node_id))
+            names_lower.append(data.get("name", "").lower())
+            ids_lower.append(node_id.lower())
+            types.append(data.get("type", "UNKNOWN"))
+            files.append(_short_path(data.get("file_path", "")))
+            lines.append(data.get("line_number", 0))
+            langs.append(data.get("language", ""))
+            stats_langs.append(data.get("language", "unknown"))
+            confs.append(data.get("confidence", "HIGH"))
+            type_buckets[data.get("type")].append(i)
+            lang_buckets[data.get("language", "").lower()].append(i)
+            node_trigrams = set()
+            for text in (names_lower[i], ids_lower[i]):
+                node_trigrams.update(text[j:j + 3] for j in range(len(text) - 2))
+            for trigram in node_trigrams:
+                trigrams[trigram].append(i)
+        return {
+            "ids": ids,
+            "names": names,
+            "names_lower": names_lower,
+            "ids_lower": ids_lower,
+            "types": types,
+            "files": files,
+            "lines": lines,
+            "langs": langs,
+            "stats_langs": stats_langs,
+            "confs": confs,
+            "type_buckets": type_buckets,
+            "lang_buckets": lang_buckets,
+            "trigrams": trigrams,
+        }
+
+    def build_stats(graph, soa: dict) -> dict:
+        """Count nodes and edges of the graph, served as-is by /api/stats."""
+        # Count by type
+        type_counts = Counter(soa["types"])
+        language_counts = Counter(soa["stats_langs"])
+        confidence_counts = Counter(soa["confs"])
+
+        # Count edge types
+        edge_counts = Counter(
+            data.get("relationship", "UNKNOWN") for _, _, data in graph.edges(data=True)
+        )
+
+        return {
+            "total_nodes": graph.number_of_nodes(),
+            "total_edges": graph.number_of_edges(),
+            "nodes_by_type": type_counts,
+            "nodes_by_language": language_counts,
+            "nodes_by_confidence": confidence_counts,
+            "edges_by_type": edge_counts
+        }
+
+    def build_graph_csr(graph, ids: list[str]) -> dict:
+        """Pack the graph's adjacency into int arrays (compressed sparse rows).
+
+        Nodes are numbered by their position in ids. The out-edges of node u
+        are positions out_ptr[u] to out_ptr[u + 1] of out_idx (target numbers),
+        out_rel and out_conf, in the same order as graph.succ[u]. The in_*
+        arrays do the same for in-edges, in graph.pred order.
+        """
+        index = {node_id: i for i, node_id in enumerate(ids)}
+        csr = {"ids": ids, "index": index}
+        for prefix, adjacency in (("out", graph.succ), ("in", graph.pred)):
+            ptr = array("i", [0])
+            idx = array("i")
+            rels = []
+            confs = []
+            for node_id in ids:
+                for neighbor, data in adjacency[node_id].items():
+                    idx.append(index[neighbor])
+                    rels.append(data.get("relationship", "UNKNOWN"))
+                    confs.append(data.get("confidence", "HIGH"))
+                ptr.append(len(idx))
+            csr[f"{prefix}_ptr"] = ptr
+            csr[f"{prefix}_idx"] = idx
+            csr[f"{prefix}_rel"] = rels
+            csr[f"{prefix}_conf"] = confs
+        return csr
+
+    @lru_cache(maxsize=None)
+    def node_view(node_id: str) -> dict:
+        """Get the id/name/type/file/line summary of a node.
+
+        The dict is shared between responses and must not be modified;
+        copy it to add keys.
+        """
+        data = app.config["GRAPH_BUILDER"].graph.nodes.get(node_id, {})
+        return {
+            "id": node_id,
+            "name": data.get("name", node_id),
+            "type": data.get("type", "UNKNOWN"),
+            "file": _short_path(data.get("file_path", "")),
+            "line": data.get("line_number", 0)
+        }
+
     def get_queries() -> GraphQueries:
         """Get graph queries instance."""
         get_builder()
@@ -64,15 +272,15 @@ def create_app(scan_path: str = "F:/Reach") -> Flask:
         get_builder()
         return app.config["DEPENDENCY_ANALYZER"]
 
-    def short_path(file_path: str) -> str:
-        """Shorten file path for display."""
-        if not file_path:
-            return ""
-        for prefix in ["F:/Reach/", "F:\\Reach\\", "/", "\\"]:
-            if file_path.startswith(prefix):
-                file_path = file_path[len(prefix):]
-                break
-        return file_path.replace("\\", "/")
+    def get_node_soa() -> dict:
+        """Get per-node attribute lists of the current graph."""
+        get_builder()
+        return app.config["NODE_SOA"]
+
+    def get_graph_csr() -> dict:
+        """Get the int-array adjacency of the current graph."""
+        get_builder()
+        return app.config["GRAPH_CSR"]
 
     def get_code_snippet(file_path: str, line_number: int, context: int = 5) -> str:
         """Get code snippet from file."""
@@ -87,22 +295,28 @@ def create_app(scan_path: str = "F:/Reach") -> Flask:
         if not os.path.exists(full_path):
             return ""
 
-        try:
-            with open(full_path, "r", encoding="utf-8", errors="ignore") as f:
-                lines = f.readlines()
-
-            start = max(0, line_number - context - 1)
-            end = min(len(lines), line_number + context)
-
-            snippet_lines = []
-            for i in range(start, end):
-                line_num = i + 1
-                marker = "→ " if line_num == line_number else "  "
-                snippet_lines.append(f"{marker}{line_num:4d} | {lines[i].rstrip()}")
-
-            return "\n".join(snippet_lines)
-        except Exception:
-            return ""
+        # Served from linecache's process-wide cache, reloaded if the file changed
+        linecache.checkcache(full_path)
+        lines = linecache.getlines(full_path)
+        if not lines:
+            # linecache gives up on files that are not valid UTF-8; read
+            # them the way the parsers do, with replacement characters
+            try:
+                with open(full_path, "r", encoding="utf-8", errors="replace") as f:
+                    lines = f.readlines()
+            except OSError:
+                return ""
+
+        start = max(0, line_number - context - 1)
+        end = min(len(lines), line_number + context)
+
+        snippet_lines = []
+        for i in range(start, end):
+            line_num = i + 1
+            marker = "→ " if line_num == line_number else "  "
+            snippet_lines.append(f"{marker}{line_num:4d} | {lines[i].rstrip()}")
+
+        return "\n".join(snippet_lines)
 
     # =====================
     # Static File Routes
@@ -116,12 +330,12 @@ def create_app(scan_path: str = "F:/Reach") -> Flask:
     @app.route("/css/<path:filename>")
     def css(filename):
         """Serve CSS files."""
-        return send_from_directory(frontend_path / "css", filename)
+        return send_from_directory(frontend_path / "css", filename, max_age=static_max_age)
 
     @app.route("/js/<path:filename>")
     def js(filename):
         """Serve JavaScript files."""
-        return send_from_directory(frontend_path / "js", filename)
+        return send_from_directory(frontend_path / "js", filename, max_age=static_max_age)
 
     # =====================
     # API Routes
@@ -129,55 +343,97 @@ def create_app(scan_path: str = "F:/Reach") -> Flask:
 
     @app.route("/api/graph")
     def get_graph():
-        """Get full graph data as JSON."""
+        """Stream graph data as newline-delimited JSON.
+
+        Each line is a record {"type": ..., "data": ...}: one "node" record
+        per node, then one "edge" record per edge between those nodes, then
+        a "summary" record with the graph totals. Clients accepting gzip get
+        the stream gzipped as it is produced; others get one buffered body.
+        """
         builder = get_builder()
         graph = builder.graph
+        soa = get_node_soa()
+        csr = get_graph_csr()
 
         # Get filter parameters
         node_type = request.args.get("type", "").upper()
         language = request.args.get("language", "").lower()
         limit = request.args.get("limit", type=int, default=500)
 
-        nodes = []
-        node_ids = set()
-
-        for node_id, data in graph.nodes(data=True):
-            # Apply filters
-            if node_type and data.get("type") != node_type:
-                continue
-            if language and data.get("language", "").lower() != language:
-                continue
-
-            node_ids.add(node_id)
-            nodes.append({
-                "id": node_id,
-                "name": data.get("name", node_id),
-                "type": data.get("type", "UNKNOWN"),
-                "file": short_path(data.get("file_path", "")),
-                "line": data.get("line_number", 0),
-                "language": data.get("language", ""),
-                "confidence": data.get("confidence", "HIGH")
-            })
-
-            if len(nodes) >= limit:
-                break
-
-        edges = []
-        for source, target, data in graph.edges(data=True):
-            if source in node_ids and target in node_ids:
-                edges.append({
-                    "from": source,
-                    "to": target,
-                    "relationship": data.get("relationship", "UNKNOWN"),
-                    "confidence": data.get("confidence", "HIGH")
-                })
-
-        return jsonify({
-            "nodes": nodes,
-            "edges": edges,
-            "total_nodes": graph.number_of_nodes(),
-            "total_edges": graph.number_of_edges()
-        })
+        ids = soa["ids"]
+        names = soa["names"]
+        types = soa["types"]
+        files = soa["files"]
+        lines = soa["lines"]
+        langs = soa["langs"]
+        confs = soa["confs"]
+
+        # Only visit nodes in the bucket of the first filter given
+        if node_type:
+            candidates = soa["type_buckets"].get(node_type, ())
+        elif language:
+            candidates = soa["lang_buckets"].get(language, ())
+        else:
+            candidates = range(len(ids))
+
+        def stream():
+            dumps = orjson.dumps
+            node_order = []
+            chosen = set()
+
+            for i in candidates:
+                # Apply the other filter
+                if language and langs[i].lower() != language:
+                    continue
+
+                node_id = ids[i]
+                node_order.append(i)
+                chosen.add(i)
+                yield dumps({"type": "node", "data": {
+                    "id": node_id,
+                    "name": names[i],
+                    "type": types[i],
+                    "file": files[i],
+                    "line": lines[i],
+                    "language": langs[i],
+                    "confidence": confs[i]
+                }}) + b"\n"
+
+                if len(node_order) >= limit:
+                    break
+
+            # Only the chosen nodes' out-edges can connect two chosen nodes
+            out_ptr = csr["out_ptr"]
+            out_idx = csr["out_idx"]
+            out_rel = csr["out_rel"]
+            out_conf = csr["out_conf"]
+            for u in node_order:
+                for e in range(out_ptr[u], out_ptr[u + 1]):
+                    v = out_idx[e]
+                    if v in chosen:
+                        yield dumps({"type": "edge", "data": {
+                            "from": ids[u],
+                            "to": ids[v],
+                            "relationship": out_rel[e],
+                            "confidence": out_conf[e]
+                        }}) + b"\n"
+
+            yield dumps({"type": "summary", "data": {
+                "total_nodes": graph.number_of_nodes(),
+                "total_edges": graph.number_of_edges()
+            }}) + b"\n"
+
+        if request.accept_encodings["gzip"]:
+            response = Response(
+                _gzip_stream(stream(), app.config["COMPRESS_LEVEL"]),
+                mimetype="application/x-ndjson"
+            )
+            response.headers["Content-Encoding"] = "gzip"
+            response.vary.add("Accept-Encoding")
+            return response
+
+        # Buffered, so Flask-Compress can still apply another encoding
+        return Response(b"".join(stream()), mimetype="application/x-ndjson")
 
     @app.route("/api/node/<path:node_id>")
     def get_node(node_id: str):
@@ -186,7 +442,7 @@ def create_app(scan_path: str = "F:/Reach") -> Flask:
         graph = builder.graph
 
         if node_id not in graph:
-            return jsonify({"error": "Node not found"}), 404
+            return _json({"error": "Node not found"}), 404
 
         data = graph.nodes[node_id]
         file_path = data.get("file_path", "")
@@ -213,11 +469,11 @@ def create_app(scan_path: str = "F:/Reach") -> Flask:
                 "source_type": source_data.get("type", "UNKNOWN")
             })
 
-        return jsonify({
+        return _json({
             "id": node_id,
             "name": data.get("name", node_id),
             "type": data.get("type", "UNKNOWN"),
-            "file": short_path(file_path),
+            "file": _short_path(file_path),
             "full_path": file_path,
             "line": line_number,
             "language": data.get("language", ""),
@@ -231,38 +487,8 @@ def create_app(scan_path: str = "F:/Reach") -> Flask:
     @app.route("/api/stats")
     def get_stats():
         """Get graph statistics."""
-        builder = get_builder()
-        graph = builder.graph
-
-        # Count by type
-        type_counts = {}
-        language_counts = {}
-        confidence_counts = {}
-
-        for _, data in graph.nodes(data=True):
-            node_type = data.get("type", "UNKNOWN")
-            type_counts[node_type] = type_counts.get(node_type, 0) + 1
-
-            language = data.get("language", "unknown")
-            language_counts[language] = language_counts.get(language, 0) + 1
-
-            confidence = data.get("confidence", "HIGH")
-            confidence_counts[confidence] = confidence_counts.get(confidence, 0) + 1
-
-        # Count edge types
-        edge_counts = {}
-        for _, _, data in graph.edges(data=True):
-            rel = data.get("relationship", "UNKNOWN")
-            edge_counts[rel] = edge_counts.get(rel, 0) + 1
-
-        return jsonify({
-            "total_nodes": graph.number_of_nodes(),
-            "total_edges": graph.number_of_edges(),
-            "nodes_by_type": type_counts,
-            "nodes_by_language": language_counts,
-            "nodes_by_confidence": confidence_counts,
-            "edges_by_type": edge_counts
-        })
+        get_builder()
+        return _json(app.config["STATS_CACHE"])
 
     @app.route("/api/search")
     def search():
@@ -272,42 +498,61 @@ def create_app(scan_path: str = "F:/Reach") -> Flask:
         node_type = request.args.get("type", "").upper()
 
         if not query:
-            return jsonify({"results": []})
-
-        builder = get_builder()
-        graph = builder.graph
+            return _json({"results": []})
+
+        soa = get_node_soa()
+        ids = soa["ids"]
+        names = soa["names"]
+        names_lower = soa["names_lower"]
+        ids_lower = soa["ids_lower"]
+        types = soa["types"]
+        files = soa["files"]
+        lines = soa["lines"]
+
+        if len(query) >= 3:
+            # A match contains every trigram of the query, so only the nodes
+            # listed under its rarest trigram need checking
+            trigrams = soa["trigrams"]
+            candidates = min(
+                (trigrams.get(query[j:j + 3], ()) for j in range(len(query) - 2)),
+                key=len
+            )
+            if node_type:
+                candidates = [i for i in candidates if types[i] == node_type]
+        elif node_type:
+            # Apply type filter by only visiting that type's nodes
+            candidates = soa["type_buckets"].get(node_type, ())
+        else:
+            candidates = range(len(ids))
 
         results = []
-        for node_id, data in graph.nodes(data=True):
-            name = data.get("name", "").lower()
-
-            # Apply type filter
-            if node_type and data.get("type") != node_type:
-                continue
+        for i in candidates:
+            name = names_lower[i]
 
             # Simple fuzzy matching
-            if query in name or query in node_id.lower():
+            if query in name or query in ids_lower[i]:
+                node_id = ids[i]
                 score = 100 if name == query else (90 if name.startswith(query) else 50)
                 results.append({
                     "id": node_id,
-                    "name": data.get("name", node_id),
-                    "type": data.get("type", "UNKNOWN"),
-                    "file": short_path(data.get("file_path", "")),
-                    "line": data.get("line_number", 0),
+                    "name": names[i],
+                    "type": types[i],
+                    "file": files[i],
+                    "line": lines[i],
                     "score": score
                 })
 
-        # Sort by score descending
-        results.sort(key=lambda x: (-x["score"], x["name"]))
+        # Top results by score descending
+        results = heapq.nsmallest(limit, results, key=lambda x: (-x["score"], x["name"]))
 
-        return jsonify({"results": results[:limit]})
+        return _json({"results": results})
 
     @app.route("/api/query", methods=["POST"])
     def execute_query():
         """Execute a query and return results."""
         data = request.get_json()
         if not data:
-            return jsonify({"error": "No query provided"}), 400
+            return _json({"error": "No query provided"}), 400
 
         query_text = data.get("query", "").lower()
         query_type = data.get("type", "auto")
@@ -322,8 +567,16 @@ def create_app(scan_path: str = "F:/Reach") -> Flask:
         result_edges = []
         message = ""
 
+        # Nodes can be reached more than once; keep the first of each
+        seen_ids = set()
+
+        def add_node(node: dict) -> None:
+            if node["id"] not in seen_ids:
+                seen_ids.add(node["id"])
+                result_nodes.append(node)
+
         # Path query: "show path from X to Y" or "path X to Y"
-        path_match = re.search(r"(?:show\s+)?path\s+(?:from\s+)?['\"]?(\w+)['\"]?\s+(?:to\s+)?['\"]?(\w+)['\"]?", query_text)
+        path_match = _PATH_QUERY_RE.search(query_text)
         if path_match or query_type == "path":
             if path_match:
                 start_name = path_match.group(1)
@@ -345,25 +598,23 @@ def create_app(scan_path: str = "F:/Reach") -> Flask:
                         path_node_ids.add(step.node_id)
 
                 for node_id in path_node_ids:
-                    node_data = graph.nodes.get(node_id, {})
-                    result_nodes.append({
-                        "id": node_id,
-                        "name": node_data.get("name", node_id),
-                        "type": node_data.get("type", "UNKNOWN"),
-                        "file": short_path(node_data.get("file_path", "")),
-                        "line": node_data.get("line_number", 0),
-                        "highlight": True
-                    })
+                    add_node({**node_view(node_id), "highlight": True})
 
                 # Add edges between path nodes
+                csr = get_graph_csr()
+                ids = csr["ids"]
+                out_ptr = csr["out_ptr"]
+                out_idx = csr["out_idx"]
+                out_rel = csr["out_rel"]
+                path_idx = {csr["index"][node_id] for node_id in path_node_ids}
                 for source in path_node_ids:
-                    for target in path_node_ids:
-                        if graph.has_edge(source, target):
-                            edge_data = graph.get_edge_data(source, target, {})
+                    u = csr["index"][source]
+                    for e in range(out_ptr[u], out_ptr[u + 1]):
+                        if out_idx[e] in path_idx:
                             result_edges.append({
                                 "from": source,
-                                "to": target,
-                                "relationship": edge_data.get("relationship", "UNKNOWN"),
+                                "to": ids[out_idx[e]],
+                                "relationship": out_rel[e],
                                 "highlight": True
                             })
             else:
@@ -371,7 +622,7 @@ def create_app(scan_path: str = "F:/Reach") -> Flask:
 
         # Usage query: "where is X used?" or "what uses X?"
         elif "used" in query_text or "uses" in query_text or query_type == "usage":
-            name_match = re.search(r"(?:where\s+is\s+)?['\"]?(\w+)['\"]?\s+used|what\s+uses\s+['\"]?(\w+)['\"]?", query_text)
+            name_match = _USAGE_QUERY_RE.search(query_text)
             if name_match:
                 name = name_match.group(1) or name_match.group(2)
                 usage_result = queries.find_usages(name)
@@ -380,7 +631,7 @@ def create_app(scan_path: str = "F:/Reach") -> Flask:
                     message = f"Found {usage_result.total_usages} usage(s) of {name}"
 
                     # Add the target node
-                    result_nodes.append({
+                    add_node({
                         "id": usage_result.node_id,
                         "name": usage_result.node_name,
                         "type": "TARGET",
@@ -391,11 +642,11 @@ def create_app(scan_path: str = "F:/Reach") -> Flask:
 
                     for usage in usage_result.usages[:20]:
                         node_data = graph.nodes.get(usage["node_id"], {})
-                        result_nodes.append({
+                        add_node({
                             "id": usage["node_id"],
                             "name": usage["node_name"],
                             "type": node_data.get("type", "UNKNOWN"),
-                            "file": short_path(node_data.get("file_path", "")),
+                            "file": _short_path(node_data.get("file_path", "")),
                             "line": node_data.get("line_number", 0)
                         })
                         result_edges.append({
@@ -408,7 +659,7 @@ def create_app(scan_path: str = "F:/Reach") -> Flask:
 
         # Caller query: "what calls X?"
         elif "calls" in query_text or query_type == "callers":
-            name_match = re.search(r"what\s+calls\s+['\"]?(\w+)['\"]?", query_text)
+            name_match = _CALLERS_QUERY_RE.search(query_text)
             if name_match:
                 name = name_match.group(1)
                 callers_result = queries.find_callers(name)
@@ -420,21 +671,21 @@ def create_app(scan_path: str = "F:/Reach") -> Flask:
                     target_matches = queries.find_node_by_name(name, node_type="FUNCTION")
                     if target_matches:
                         target = target_matches[0]
-                        result_nodes.append({
+                        add_node({
                             "id": target["id"],
                             "name": target["name"],
                             "type": "FUNCTION",
-                            "file": short_path(target["file"]),
+                            "file": _short_path(target["file"]),
                             "line": target["line"],
                             "highlight": True
                         })
 
                         for caller in callers_result.usages[:20]:
-                            result_nodes.append({
+                            add_node({
                                 "id": caller["node_id"],
                                 "name": caller["node_name"],
                                 "type": "FUNCTION",
-                                "file": short_path(caller.get("file", "")),
+                                "file": _short_path(caller.get("file", "")),
                                 "line": caller.get("line", 0)
                             })
                             result_edges.append({
@@ -447,7 +698,7 @@ def create_app(scan_path: str = "F:/Reach") -> Flask:
 
         # Signal trace: "trace signal X"
         elif "signal" in query_text or query_type == "signal":
-            name_match = re.search(r"(?:trace\s+)?signal\s+['\"]?(\w+)['\"]?", query_text)
+            name_match = _SIGNAL_QUERY_RE.search(query_text)
             if name_match:
                 name = name_match.group(1)
                 signal_result = tracer.trace_signal_flow(name)
@@ -457,7 +708,7 @@ def create_app(scan_path: str = "F:/Reach") -> Flask:
 
                     # Add signal definition
                     if signal_result.definition:
-                        result_nodes.append({
+                        add_node({
                             "id": signal_result.signal_id,
                             "name": signal_result.definition.node_name,
                             "type": "SIGNAL",
@@ -468,7 +719,7 @@ def create_app(scan_path: str = "F:/Reach") -> Flask:
 
                     # Add emitters
                     for emission in signal_result.emissions[:10]:
-                        result_nodes.append({
+                        add_node({
                             "id": emission.node_id,
                             "name": emission.node_name,
                             "type": emission.node_type,
@@ -484,7 +735,7 @@ def create_app(scan_path: str = "F:/Reach") -> Flask:
 
                     # Add handlers
                     for handler in signal_result.handlers[:10]:
-                        result_nodes.append({
+                        add_node({
                             "id": handler.node_id,
                             "name": handler.node_name,
                             "type": handler.node_type,
@@ -503,7 +754,7 @@ def create_app(scan_path: str = "F:/Reach") -> Flask:
         # Default: search and show related
         else:
             # Extract a name from the query
-            words = re.findall(r'\b\w+\b', query_text)
+            words = _WORD_RE.findall(query_text)
             search_term = max(words, key=len) if words else query_text
 
             matches = queries.find_node_by_name(search_term)
@@ -511,27 +762,19 @@ def create_app(scan_path: str = "F:/Reach") -> Flask:
                 message = f"Found {len(matches)} match(es) for '{search_term}'"
 
                 for match in matches[:10]:
-                    node_data = graph.nodes.get(match["id"], {})
-                    result_nodes.append({
+                    add_node({
                         "id": match["id"],
                         "name": match["name"],
                         "type": match["type"],
-                        "file": short_path(match["file"]),
+                        "file": _short_path(match["file"]),
                         "line": match["line"],
                         "highlight": True
                     })
 
                     # Add connected nodes
                     for _, target in graph.out_edges(match["id"]):
-                        target_data = graph.nodes.get(target, {})
                         edge_data = graph.get_edge_data(match["id"], target, {})
-                        result_nodes.append({
-                            "id": target,
-                            "name": target_data.get("name", target),
-                            "type": target_data.get("type", "UNKNOWN"),
-                            "file": short_path(target_data.get("file_path", "")),
-                            "line": target_data.get("line_number", 0)
-                        })
+                        add_node(node_view(target))
                         result_edges.append({
                             "from": match["id"],
                             "to": target,
@@ -540,17 +783,9 @@ def create_app(scan_path: str = "F:/Reach") -> Flask:
             else:
                 message = f"No matches found for '{search_term}'"
 
-        # Deduplicate nodes
-        seen_ids = set()
-        unique_nodes = []
-        for node in result_nodes:
-            if node["id"] not in seen_ids:
-                seen_ids.add(node["id"])
-                unique_nodes.append(node)
-
-        return jsonify({
+        return _json({
             "message": message,
-            "nodes": unique_nodes,
+            "nodes": result_nodes,
             "edges": result_edges
         })
 
@@ -561,7 +796,7 @@ def create_app(scan_path: str = "F:/Reach") -> Flask:
         graph = builder.graph
 
         if node_id not in graph:
-            return jsonify({"error": "Node not found"}), 404
+            return _json({"error": "Node not found"}), 404
 
         depth = request.args.get("depth", type=int, default=1)
 
@@ -569,58 +804,59 @@ def create_app(scan_path: str = "F:/Reach") -> Flask:
             "id": node_id,
             **{k: v for k, v in graph.nodes[node_id].items() if k != "metadata"}
         }]
+        # Walk the int-array adjacency; node numbers map back through ids
+        csr = get_graph_csr()
+        ids = csr["ids"]
+        out_ptr = csr["out_ptr"]
+        out_idx = csr["out_idx"]
+        out_rel = csr["out_rel"]
+        in_ptr = csr["in_ptr"]
+        in_idx = csr["in_idx"]
+        in_rel = csr["in_rel"]
+
         edges = []
-        visited = {node_id}
-        frontier = [node_id]
+        start = csr["index"][node_id]
+        visited = {start}
+        frontier = [start]
 
         for _ in range(depth):
             next_frontier = []
-            for current in frontier:
+            for u in frontier:
+                current = ids[u]
+
                 # Outgoing
-                for _, target in graph.out_edges(current):
-                    if target not in visited:
-                        visited.add(target)
-                        next_frontier.append(target)
-                        target_data = graph.nodes.get(target, {})
-                        nodes.append({
-                            "id": target,
-                            "name": target_data.get("name", target),
-                            "type": target_data.get("type", "UNKNOWN"),
-                            "file": short_path(target_data.get("file_path", "")),
-                            "line": target_data.get("line_number", 0)
-                        })
+                for e in range(out_ptr[u], out_ptr[u + 1]):
+                    v = out_idx[e]
+                    target = ids[v]
+                    if v not in visited:
+                        visited.add(v)
+                        next_frontier.append(v)
+                        nodes.append(node_view(target))
 
-                    edge_data = graph.get_edge_data(current, target, {})
                     edges.append({
                         "from": current,
                         "to": target,
-                        "relationship": edge_data.get("relationship", "UNKNOWN")
+                        "relationship": out_rel[e]
                     })
 
                 # Incoming
-                for source, _ in graph.in_edges(current):
-                    if source not in visited:
-                        visited.add(source)
-                        next_frontier.append(source)
-                        source_data = graph.nodes.get(source, {})
-                        nodes.append({
-                            "id": source,
-                            "name": source_data.get("name", source),
-                            "type": source_data.get("type", "UNKNOWN"),
-                            "file": short_path(source_data.get("file_path", "")),
-                            "line": source_data.get("line_number", 0)
-                        })
+                for e in range(in_ptr[u], in_ptr[u + 1]):
+                    v = in_idx[e]
+                    source = ids[v]
+                    if v not in visited:
+                        visited.add(v)
+                        next_frontier.append(v)
+                        nodes.append(node_view(source))
 
-                    edge_data = graph.get_edge_data(source, current, {})
                     edges.append({
                         "from": source,
                         "to": current,
-                        "relationship": edge_data.get("relationship", "UNKNOWN")
+                        "relationship": in_rel[e]
                     })
 
             frontier = next_frontier
 
-        return jsonify({
+        return _json({
             "nodes": nodes,
             "edges": edges
         })
@@ -631,6 +867,7 @@ def create_app(scan_path: str = "F:/Reach") -> Flask:
 def run_server(host: str = "127.0.0.1", port: int = 5000, scan_path: str = "F:/Reach"):
     """Run the development server."""
     app = create_app(scan_path)
+    app.config["RICH_LOGGING"] = sys.stderr.isatty()
     print(f"Starting server at http://{host}:{port}")
     print(f"Scanning: {scan_path}")
     app.run(host=host, port=port, debug=True, threaded=True)
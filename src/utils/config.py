@@ -4,12 +4,20 @@ from pathlib import Path
 from typing import Any, Optional
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
 
 class Config:
     """Configuration manager with lazy loading and defaults."""
 
     _instance: Optional["Config"] = None
     _config: dict = {}
+    # Every value of the defaults and the loaded config by dotted key,
+    # loaded values taking precedence
+    _flat: dict = {}
 
     DEFAULT_CONFIG = {
         "project": {
@@ -45,32 +53,30 @@ class Config:
 
         if config_path.exists():
             with open(config_path, "r", encoding="utf-8") as f:
-                self._config = yaml.safe_load(f) or {}
+                self._config = yaml.load(f, Loader=SafeLoader) or {}
         else:
             self._config = {}
 
+        flat = {}
+        self._flatten(self.DEFAULT_CONFIG, "", flat)
+        self._flatten(self._config, "", flat)
+        self._flat = flat
+
+    @staticmethod
+    def _flatten(data: dict, prefix: str, out: dict) -> None:
+        """Record every value under data, nested dicts included, by dotted key."""
+        for k, value in data.items():
+            key = f"{prefix}{k}"
+            out[key] = value
+            if isinstance(value, dict):
+                Config._flatten(value, f"{key}.", out)
+
     def get(self, key: str, default: Any = None) -> Any:
         """Get config value using dot notation (e.g., 'project.root_path')."""
-        if not self._config:
+        if not self._flat:
             self.load()
 
-        keys = key.split(".")
-        value = self._config
-
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                # Try default config
-                default_value = self.DEFAULT_CONFIG
-                for dk in keys:
-                    if isinstance(default_value, dict) and dk in default_value:
-                        default_value = default_value[dk]
-                    else:
-                        return default
-                return default_value
-
-        return value
+        return self._flat.get(key, default)
 
     @property
     def project_root(self) -> Path:
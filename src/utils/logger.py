@@ -13,7 +13,7 @@ def setup_logger(
     name: str = "reach_visualizer",
     level: str = "INFO",
     log_file: Optional[Path] = None,
-    rich_output: bool = True
+    rich_output: bool = False
 ) -> logging.Logger:
     """Set up and configure logger.
 
@@ -61,5 +61,6 @@ def setup_logger(
     return logger
 
 
-# Default logger instance
+# Default logger instance. Plain stderr output keeps library logging cheap;
+# the CLI's --verbose flag sets it up again with rich output.
 logger = setup_logger()
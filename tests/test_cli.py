@@ -0,0 +1,31 @@
+"""Tests for the command-line interface."""
+
+import logging
+from pathlib import Path
+
+from click.testing import CliRunner
+from rich.logging import RichHandler
+
+from cli import cli
+
+
+def _build_handlers() -> list[logging.Handler]:
+    return logging.getLogger("graph_builder").handlers
+
+
+def test_verbose_gives_build_logger_rich_output(tmp_path: Path):
+    (tmp_path / "main.gd").write_text("extends Node\n", encoding="utf-8")
+
+    result = CliRunner().invoke(cli, ["--verbose", "scan", "-p", str(tmp_path)])
+
+    assert result.exit_code == 0, result.output
+    assert any(isinstance(h, RichHandler) for h in _build_handlers())
+
+
+def test_non_interactive_build_logger_is_plain(tmp_path: Path):
+    (tmp_path / "main.gd").write_text("extends Node\n", encoding="utf-8")
+
+    result = CliRunner().invoke(cli, ["scan", "-p", str(tmp_path)])
+
+    assert result.exit_code == 0, result.output
+    assert not any(isinstance(h, RichHandler) for h in _build_handlers())
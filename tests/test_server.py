@@ -0,0 +1,69 @@
+"""Tests for the Flask API server."""
+
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from src.graph import GraphBuilder
+from src.server.app import create_app
+
+
+PLAYER_GD = """extends Node
+
+signal died
+
+func take_damage(amount):
+\tdied.emit()
+"""
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    (tmp_path / "player.gd").write_text(PLAYER_GD, encoding="utf-8")
+    return tmp_path
+
+
+def test_stats_count_only_missing_language_as_unknown(project: Path, monkeypatch):
+    build_graph = GraphBuilder.build_graph
+
+    def build_with_extra_nodes(self, *args, **kwargs):
+        stats = build_graph(self, *args, **kwargs)
+        self.graph.add_node("empty_language", type="FUNCTION", language="")
+        self.graph.add_node("missing_language", type="FUNCTION")
+        return stats
+
+    monkeypatch.setattr(GraphBuilder, "build_graph", build_with_extra_nodes)
+    client = create_app(str(project)).test_client()
+
+    languages = client.get("/api/stats").get_json()["nodes_by_language"]
+
+    assert languages[""] == 1
+    assert languages["unknown"] == 1
+
+
+def _records(body: bytes) -> list[dict]:
+    return [json.loads(line) for line in body.splitlines() if line]
+
+
+def test_graph_is_gzipped_while_streaming(project: Path):
+    client = create_app(str(project)).test_client()
+
+    response = client.get("/api/graph", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert response.is_streamed
+    records = _records(gzip.decompress(response.data))
+    assert any(r["type"] == "node" for r in records)
+    assert records[-1]["type"] == "summary"
+
+
+def test_graph_without_gzip_is_plain_ndjson(project: Path):
+    client = create_app(str(project)).test_client()
+
+    response = client.get("/api/graph")
+
+    assert "Content-Encoding" not in response.headers
+    assert _records(response.data)[-1]["type"] == "summary"
@@ -0,0 +1,41 @@
+"""Tests for the TSCN scene parser."""
+
+from pathlib import Path
+
+from src.parsers.base_parser import NodeType
+from src.parsers.tscn_parser import TSCNParser
+
+
+SCENE = """[gd_scene load_steps=2 format=3]
+
+[ext_resource type="Script" path="res://player.gd" id="1"]
+
+[node name="Player" type="CharacterBody2D"]
+script = ExtResource("1")
+"""
+
+
+def test_read_error_is_reported_not_raised(tmp_path: Path):
+    parser = TSCNParser(tmp_path)
+
+    result = parser.parse_file(tmp_path / "missing.tscn")
+
+    assert not result.success
+    assert result.errors[0].startswith("Failed to read file")
+
+
+def test_cached_result_matches_current_content(tmp_path: Path):
+    scene = tmp_path / "player.tscn"
+    scene.write_text(SCENE, encoding="utf-8")
+    parser = TSCNParser(tmp_path)
+
+    first = parser.parse_file(scene)
+    assert parser.parse_file(scene) is first
+
+    scene.write_text(SCENE.replace("Player", "Hero"), encoding="utf-8")
+    second = parser.parse_file(scene)
+
+    assert second is not first
+    assert second.file_hash != first.file_hash
+    names = {n.name for n in second.nodes if n.type == NodeType.NODE_REFERENCE}
+    assert names == {"Hero"}